@@ -1,6 +1,20 @@
 """Slide Deck Agent - Create industry-standard PowerPoint presentations with AI."""
 
-from .agent import SlideDeckAgent
+from typing import TYPE_CHECKING
+
 from .models import PresentationRequest, SlideContent, SlideType
 
+if TYPE_CHECKING:
+    from .agent import SlideDeckAgent
+
 __all__ = ["SlideDeckAgent", "PresentationRequest", "SlideContent", "SlideType"]
+
+
+def __getattr__(name):
+    # The agent pulls in python-pptx and every skill; import it on first use so
+    # that importing the models (or the llapi layer) stays cheap.
+    if name == "SlideDeckAgent":
+        from .agent import SlideDeckAgent
+
+        return SlideDeckAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,6 +14,7 @@ Components:
     - DocumentParser: Parses source documents (text, markdown, PDF)
     - StructureRecommender: Recommends optimal slide structure based on content
     - PromptTemplates: Pre-built prompts for different presentation types
+    - SlidePromptCache: Persistent cache of per-slide LLM responses
 
 Usage:
     from slide_deck_agent.llapi import ContentGenerator
@@ -30,10 +31,12 @@ from .content_generator import ContentGenerator
 from .document_parser import DocumentParser
 from .structure_recommender import StructureRecommender
 from .prompt_templates import PromptTemplates
+from .slide_cache import SlidePromptCache
 
 __all__ = [
     "ContentGenerator",
     "DocumentParser",
     "StructureRecommender",
     "PromptTemplates",
+    "SlidePromptCache",
 ]
@@ -6,15 +6,74 @@ Uses LLMs to generate slide content from source documents or prompts.
 Outputs SlideContent objects that feed directly into the template engine.
 """
 
+import asyncio
 import json
 import os
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
-from ..models import SlideContent, SlideType, PresentationRequest
+from ..models import (
+    SlideContent,
+    SlideType,
+    PresentationRequest,
+    get_presentation_draft_json_schema,
+    get_single_slide_draft_json_schema,
+)
 from .document_parser import DocumentParser
 from .structure_recommender import StructureRecommender
 from .prompt_templates import PromptTemplates
+from .slide_cache import SlidePromptCache
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+# Tool / schema names used for structured full-presentation and per-slide output
+PRESENTATION_DRAFT_TOOL = "create_presentation"
+SLIDE_DRAFT_TOOL = "create_slide"
+
+
+def _loads_json(json_str: str) -> Any:
+    """Parse LLM JSON with orjson when available, falling back to the stdlib."""
+    if orjson is not None:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            # e.g. NaN literals or oversized integers, which only json accepts
+            pass
+    return json.loads(json_str)
+
+
+def _anthropic_structured_args(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Request arguments forcing an Anthropic response through a tool with this schema."""
+    return {
+        "tools": [{
+            "name": name,
+            "description": "Return the generated content.",
+            "input_schema": schema
+        }],
+        "tool_choice": {"type": "tool", "name": name}
+    }
+
+
+def _openai_structured_args(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Request arguments enforcing this schema via OpenAI structured outputs."""
+    # Non-strict: chart_data is a free-form object
+    return {
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {"name": name, "schema": schema}
+        }
+    }
+
+
+def _tool_input(message: Any) -> Optional[Dict[str, Any]]:
+    """Return the already-parsed input of a forced tool call, if the message has one."""
+    for block in message.content:
+        if block.type == "tool_use":
+            return block.input
+    return None
 
 
 class ContentGenerator:
@@ -34,7 +93,8 @@ class ContentGenerator:
         self,
         provider: str = "anthropic",
         api_key: Optional[str] = None,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        slide_cache: Optional[SlidePromptCache] = None
     ):
         """
         Initialize the content generator.
@@ -43,10 +103,12 @@ class ContentGenerator:
             provider: LLM provider ('anthropic', 'openai', or 'mock')
             api_key: API key (defaults to environment variable)
             model: Model name (defaults based on provider)
+            slide_cache: Optional cache consulted before per-slide LLM calls
         """
         self.provider = provider.lower()
         self.api_key = api_key
         self.model = model
+        self.slide_cache = slide_cache
 
         # Initialize components
         self.parser = DocumentParser()
@@ -78,7 +140,8 @@ class ContentGenerator:
         audience: str = "investors",
         duration_minutes: int = 15,
         title: Optional[str] = None,
-        company: Optional[str] = None
+        company: Optional[str] = None,
+        token_budget: Optional[int] = None
     ) -> PresentationRequest:
         """
         Generate a complete presentation from a source document.
@@ -93,6 +156,8 @@ class ContentGenerator:
             duration_minutes: Presentation duration
             title: Override presentation title (default: extracted from content)
             company: Company/subtitle for title slide
+            token_budget: If set, documents estimated above this many tokens are
+                          reduced to their relevant sections before prompting
 
         Returns:
             PresentationRequest ready for template engine
@@ -100,6 +165,14 @@ class ContentGenerator:
         # Parse the source document
         content = self.parser.parse(source)
 
+        # Prompt length dominates latency and cost: only send what the deck needs
+        if token_budget and self.parser.get_estimated_tokens(content) > token_budget:
+            content = self.structure_recommender.prepare_document(
+                self.parser.extract_sections(content),
+                presentation_type=presentation_type,
+                token_budget=token_budget
+            )
+
         # Generate slides using LLM
         slides_data = self._generate_slides_via_llm(
             content=content,
@@ -189,32 +262,60 @@ class ContentGenerator:
         if self.provider == "mock":
             return self._mock_generate(content, max_slides)
         elif self.provider == "anthropic":
-            return self._call_anthropic(prompt)
+            return self._call_anthropic(
+                prompt,
+                cached_prefix=PromptTemplates.get_full_presentation_static_prefix(presentation_type),
+                output_schema=get_presentation_draft_json_schema()
+            )
         elif self.provider == "openai":
-            return self._call_openai(prompt)
+            # OpenAI caches shared prompt prefixes automatically
+            return self._call_openai(prompt, output_schema=get_presentation_draft_json_schema())
 
-    def _call_anthropic(self, prompt: str) -> Dict[str, Any]:
-        """Call Anthropic Claude API."""
+    def _call_anthropic(
+        self,
+        prompt: str,
+        cached_prefix: Optional[str] = None,
+        output_schema: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Call Anthropic Claude API.
+
+        Args:
+            prompt: Full user prompt
+            cached_prefix: Static head of the prompt to mark for prompt caching.
+                           Ignored unless the prompt actually starts with it.
+            output_schema: JSON schema to enforce via a forced tool call
+        """
         try:
             import anthropic
 
             client = anthropic.Anthropic(api_key=self.api_key)
 
+            structured_args = {}
+            if output_schema:
+                structured_args = _anthropic_structured_args(PRESENTATION_DRAFT_TOOL, output_schema)
+
             message = client.messages.create(
                 model=self.model,
                 max_tokens=4096,
                 system=PromptTemplates.SYSTEM_PROMPT,
                 messages=[
-                    {"role": "user", "content": prompt}
-                ]
+                    {"role": "user", "content": self._build_anthropic_content(prompt, cached_prefix)}
+                ],
+                **structured_args
             )
 
+            # Forced tool calls return already-parsed JSON
+            tool_input = _tool_input(message)
+            if tool_input is not None:
+                return tool_input
+
             # Parse JSON response
             response_text = message.content[0].text
 
             # Extract JSON from response (handle markdown code blocks)
             json_str = self._extract_json(response_text)
-            return json.loads(json_str)
+            return _loads_json(json_str)
 
         except ImportError:
             raise ImportError(
@@ -224,13 +325,37 @@ class ContentGenerator:
         except Exception as e:
             raise RuntimeError(f"Anthropic API call failed: {str(e)}")
 
-    def _call_openai(self, prompt: str) -> Dict[str, Any]:
-        """Call OpenAI API."""
+    @staticmethod
+    def _build_anthropic_content(prompt: str, cached_prefix: Optional[str]) -> Any:
+        """Split off the static prompt head as a cache_control block when present."""
+        if cached_prefix and prompt.startswith(cached_prefix):
+            return [
+                {"type": "text", "text": cached_prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": prompt[len(cached_prefix):]}
+            ]
+        return prompt
+
+    def _call_openai(
+        self,
+        prompt: str,
+        output_schema: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Call OpenAI API.
+
+        Args:
+            prompt: Full user prompt
+            output_schema: JSON schema to enforce via structured outputs
+        """
         try:
             import openai
 
             client = openai.OpenAI(api_key=self.api_key)
 
+            structured_args = {}
+            if output_schema:
+                structured_args = _openai_structured_args(PRESENTATION_DRAFT_TOOL, output_schema)
+
             response = client.chat.completions.create(
                 model=self.model,
                 messages=[
@@ -238,7 +363,8 @@ class ContentGenerator:
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=4096,
-                temperature=0.7
+                temperature=0.7,
+                **structured_args
             )
 
             # Parse JSON response
@@ -246,7 +372,7 @@ class ContentGenerator:
 
             # Extract JSON from response
             json_str = self._extract_json(response_text)
-            return json.loads(json_str)
+            return _loads_json(json_str)
 
         except ImportError:
             raise ImportError(
@@ -256,6 +382,187 @@ class ContentGenerator:
         except Exception as e:
             raise RuntimeError(f"OpenAI API call failed: {str(e)}")
 
+    def generate_slides(
+        self,
+        slide_specs: List[Dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate content for individual slides, one LLM call per slide.
+
+        Synchronous wrapper around generate_slides_concurrently(); must not be
+        called from inside a running event loop.
+        """
+        return asyncio.run(self.generate_slides_concurrently(slide_specs, max_concurrency))
+
+    async def generate_slides_concurrently(
+        self,
+        slide_specs: List[Dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate content for individual slides with concurrent LLM calls.
+
+        Used when a deck is too large for a single get_full_presentation_prompt
+        call. Slides that must flow from the previous slide are generated in
+        order, with the previous generated title passed as context; all other
+        slides are independent and generated concurrently. If a slide_cache is
+        configured it is consulted before each LLM call.
+
+        Args:
+            slide_specs: List of dicts with 'slide_type' and 'source_content',
+                         and optionally 'follows_previous': True to chain the
+                         slide to the one before it
+            max_concurrency: Maximum number of in-flight LLM requests
+
+        Returns:
+            List of slide dicts (title, bullet_points, notes) in spec order
+        """
+        # Contiguous runs of chained slides form one sequential group
+        groups: List[List[int]] = []
+        for index, spec in enumerate(slide_specs):
+            if spec.get("follows_previous") and groups:
+                groups[-1].append(index)
+            else:
+                groups.append([index])
+
+        total_slides = len(slide_specs)
+        results: List[Optional[Dict[str, Any]]] = [None] * total_slides
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate_group(indices: List[int]):
+            previous_title = None
+            for index in indices:
+                spec = slide_specs[index]
+                prompt = PromptTemplates.get_slide_generation_prompt(
+                    slide_type=spec["slide_type"],
+                    source_content=spec["source_content"],
+                    slide_number=index + 1,
+                    total_slides=total_slides,
+                    previous_slide_title=previous_title
+                )
+                cache_key = None
+                slide = None
+                if self.slide_cache is not None:
+                    cache_key = self.slide_cache.make_key(
+                        self.provider, self.model, spec["slide_type"], spec["source_content"],
+                        previous_title=previous_title if spec.get("follows_previous") else None
+                    )
+                    slide = self.slide_cache.get(cache_key)
+
+                if slide is None:
+                    async with semaphore:
+                        slide = await self._generate_slide_async(client, prompt, spec)
+                    if cache_key is not None:
+                        self.slide_cache.set(cache_key, slide)
+
+                results[index] = slide
+                previous_title = slide.get("title")
+
+        client = self._create_async_client()
+        try:
+            tasks = [asyncio.ensure_future(generate_group(group)) for group in groups]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # Don't leave the other groups' requests running after a failure
+                # (asyncio.TaskGroup semantics, which needs Python 3.11+)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        finally:
+            if client is not None:
+                await client.close()
+        return results
+
+    def _create_async_client(self):
+        """
+        Create one async client shared by all concurrent slide requests.
+
+        The caller owns the client and must close() it once all requests are
+        done; mock mode returns None.
+        """
+        if self.provider == "anthropic":
+            try:
+                import anthropic
+            except ImportError:
+                raise ImportError(
+                    "Anthropic package not installed. "
+                    "Install with: pip install anthropic"
+                )
+            return anthropic.AsyncAnthropic(api_key=self.api_key)
+        elif self.provider == "openai":
+            try:
+                import openai
+            except ImportError:
+                raise ImportError(
+                    "OpenAI package not installed. "
+                    "Install with: pip install openai"
+                )
+            return openai.AsyncOpenAI(api_key=self.api_key)
+        return None
+
+    async def _generate_slide_async(self, client, prompt: str, spec: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate a single slide's content with the async client."""
+        if self.provider == "mock":
+            return self._mock_generate_slide(spec["slide_type"], spec["source_content"])
+
+        try:
+            if self.provider == "anthropic":
+                message = await client.messages.create(
+                    model=self.model,
+                    max_tokens=PromptTemplates.SLIDE_GENERATION_MAX_TOKENS,
+                    system=PromptTemplates.SYSTEM_PROMPT,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": self._build_anthropic_content(
+                                prompt, PromptTemplates.SLIDE_GENERATION_STATIC_PREFIX
+                            )
+                        }
+                    ],
+                    **_anthropic_structured_args(
+                        SLIDE_DRAFT_TOOL, get_single_slide_draft_json_schema()
+                    )
+                )
+                tool_input = _tool_input(message)
+                if tool_input is not None:
+                    return tool_input
+                response_text = message.content[0].text
+            else:
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": PromptTemplates.SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=PromptTemplates.SLIDE_GENERATION_MAX_TOKENS,
+                    temperature=0.7,
+                    **_openai_structured_args(
+                        SLIDE_DRAFT_TOOL, get_single_slide_draft_json_schema()
+                    )
+                )
+                response_text = response.choices[0].message.content
+
+            return _loads_json(self._extract_json(response_text))
+
+        except Exception as e:
+            raise RuntimeError(f"{self.provider} slide generation failed: {str(e)}")
+
+    def _mock_generate_slide(self, slide_type: str, source_content: str) -> Dict[str, Any]:
+        """Generate mock content for a single slide without API calls."""
+        lines = [line.lstrip('•-*– ').strip() for line in source_content.split('\n')]
+        lines = [line for line in lines if line]
+
+        title = lines[0] if lines else slide_type.replace('_', ' ').capitalize()
+
+        return {
+            "title": title,
+            "bullet_points": lines[1:5],
+            "notes": ""
+        }
+
     def _mock_generate(self, content: str, max_slides: int) -> Dict[str, Any]:
         """
         Generate mock slides for testing without API calls.
@@ -735,16 +1042,35 @@ class ContentGenerator:
         for slide_dict in slides_data.get("slides", []):
             # Build slide with chart_data if present
             # Use STANDARD_CONTENT - layout will be determined automatically by template engine
-            slide = SlideContent(
-                slide_type=SlideType.STANDARD_CONTENT,
-                title=slide_dict.get("title", "Untitled Slide"),
-                bullet_points=slide_dict.get("bullet_points", []),
-                chart_data=slide_dict.get("chart_data")  # Pass through chart data
-            )
+            fields = {
+                "slide_type": SlideType.STANDARD_CONTENT,
+                "title": slide_dict.get("title", "Untitled Slide"),
+                "bullet_points": slide_dict.get("bullet_points", []),
+                "chart_data": slide_dict.get("chart_data")  # Pass through chart data
+            }
+
+            # Well-formed slides skip per-field validation; anything else goes
+            # through full validation so malformed LLM output still fails loudly
+            if self._is_well_formed_slide(fields):
+                slide = SlideContent.model_construct(**fields)
+            else:
+                slide = SlideContent(**fields)
             slides.append(slide)
 
         return slides
 
+    @staticmethod
+    def _is_well_formed_slide(fields: Dict[str, Any]) -> bool:
+        """Check that slide fields already have the exact types SlideContent expects."""
+        bullet_points = fields["bullet_points"]
+        chart_data = fields["chart_data"]
+        return (
+            isinstance(fields["title"], str)
+            and isinstance(bullet_points, list)
+            and all(isinstance(bullet, str) for bullet in bullet_points)
+            and (chart_data is None or isinstance(chart_data, dict))
+        )
+
     def refine_title(self, draft_title: str, slide_type: str = "content") -> str:
         """
         Use LLM to refine a slide title to be more insight-driven.
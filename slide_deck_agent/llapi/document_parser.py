@@ -178,6 +178,10 @@ class DocumentParser:
         """Get word count of content."""
         return len(content.split())
 
+    def get_estimated_tokens(self, content: str, chars_per_token: int = 4) -> int:
+        """Estimate LLM token count of content (roughly 4 characters per token)."""
+        return len(content) // chars_per_token
+
     def get_estimated_slides(self, content: str, words_per_slide: int = 100) -> int:
         """
         Estimate number of slides based on content length.
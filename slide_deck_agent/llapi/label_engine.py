@@ -14,7 +14,13 @@ meaningful insights that communicate the story behind the data.
 import json
 import os
 from typing import Dict, Any, Optional, Union
-from pydantic import BaseModel
+
+from ..models import (
+    DifferenceLabelRequest,
+    DifferenceLabelResponse,
+    CAGRLabelRequest,
+    CAGRLabelResponse,
+)
 
 
 # =============================================================================
@@ -49,37 +55,6 @@ RULES FOR LABEL GENERATION:
 Always respond with valid JSON only. No explanations or markdown."""
 
 
-# =============================================================================
-# REQUEST/RESPONSE MODELS
-# =============================================================================
-
-class DifferenceLabelRequest(BaseModel):
-    """Request for generating a difference line label."""
-    task: str = "generate_difference_label"
-    start_value: float
-    end_value: float
-    currency: str = "€"
-    direction: str = "reduction"  # "reduction", "increase", "change"
-
-
-class DifferenceLabelResponse(BaseModel):
-    """Response containing difference line label text."""
-    primary: str  # e.g., "€28 savings"
-    secondary: str  # e.g., "(62% reduction)"
-
-
-class CAGRLabelRequest(BaseModel):
-    """Request for generating a CAGR arrow label."""
-    task: str = "generate_cagr_label"
-    data_series: list  # e.g., [22, 35, 42, 55, 65]
-    cagr_value: float  # e.g., 0.31 for 31%
-
-
-class CAGRLabelResponse(BaseModel):
-    """Response containing CAGR label text."""
-    label: str  # e.g., "4-Year CAGR: +31%"
-
-
 # =============================================================================
 # LLM-POWERED LABEL ENGINE
 # =============================================================================
@@ -6,7 +6,39 @@ Pre-built prompts for different presentation types and content generation tasks.
 These prompts encode best practices for consulting-quality presentations.
 """
 
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
+
+
+class SlideSpec(NamedTuple):
+    """
+    One slide in a reference structure.
+
+    Also readable by key (spec["type"], spec.get("purpose")) like the plain
+    dicts reference structures used to hold.
+    """
+
+    type: str
+    purpose: str
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup of a field by name."""
+        return getattr(self, key) if key in self._fields else default
+
+
+@lru_cache(maxsize=8)
+def _render_reference_structure(presentation_type: str) -> str:
+    """Render the "- type: purpose" reference block once per presentation type."""
+    template = PromptTemplates.get_structure_template(presentation_type)
+    return "\n".join(f"- {spec.type}: {spec.purpose}" for spec in template['structure'])
 
 
 class PromptTemplates:
@@ -36,93 +68,107 @@ slides without fabricated metrics."""
     # PRESENTATION STRUCTURE TEMPLATES
     # =========================================================================
 
-    STRUCTURE_TEMPLATES = {
-        "investor_pitch": {
+    # Read-only at every level: prompt heads rendered from these templates are memoized
+    STRUCTURE_TEMPLATES = MappingProxyType({
+        "investor_pitch": MappingProxyType({
             "name": "Investor Pitch (Sequoia/YC Format)",
             "max_slides": 15,
-            "structure": [
-                {"type": "problem", "purpose": "Pain point the market faces"},
-                {"type": "solution", "purpose": "How you solve it"},
-                {"type": "market", "purpose": "Size and growth of opportunity"},
-                {"type": "value_proposition", "purpose": "Why customers choose you"},
-                {"type": "product", "purpose": "What you've built"},
-                {"type": "traction", "purpose": "Evidence of product-market fit"},
-                {"type": "business_model", "purpose": "How you make money"},
-                {"type": "go_to_market", "purpose": "How you acquire customers"},
-                {"type": "competition", "purpose": "Competitive landscape and moat"},
-                {"type": "team", "purpose": "Why this team wins"},
-                {"type": "financials", "purpose": "Projections and metrics"},
-                {"type": "ask", "purpose": "What you're raising and use of funds"},
-                {"type": "vision", "purpose": "Where this goes long-term"},
-            ]
-        },
-        "strategy_update": {
+            "structure": (
+                SlideSpec("problem", "Pain point the market faces"),
+                SlideSpec("solution", "How you solve it"),
+                SlideSpec("market", "Size and growth of opportunity"),
+                SlideSpec("value_proposition", "Why customers choose you"),
+                SlideSpec("product", "What you've built"),
+                SlideSpec("traction", "Evidence of product-market fit"),
+                SlideSpec("business_model", "How you make money"),
+                SlideSpec("go_to_market", "How you acquire customers"),
+                SlideSpec("competition", "Competitive landscape and moat"),
+                SlideSpec("team", "Why this team wins"),
+                SlideSpec("financials", "Projections and metrics"),
+                SlideSpec("ask", "What you're raising and use of funds"),
+                SlideSpec("vision", "Where this goes long-term"),
+            )
+        }),
+        "strategy_update": MappingProxyType({
             "name": "Strategy Update (McKinsey Format)",
             "max_slides": 20,
-            "structure": [
-                {"type": "executive_summary", "purpose": "Key findings in 3-5 bullets"},
-                {"type": "situation", "purpose": "Current state assessment"},
-                {"type": "challenges", "purpose": "Key issues to address"},
-                {"type": "options", "purpose": "Strategic alternatives considered"},
-                {"type": "recommendation", "purpose": "Proposed path forward"},
-                {"type": "implementation", "purpose": "How to execute"},
-                {"type": "timeline", "purpose": "Phased roadmap"},
-                {"type": "risks", "purpose": "Key risks and mitigations"},
-                {"type": "next_steps", "purpose": "Immediate actions required"},
-            ]
-        },
-        "product_overview": {
+            "structure": (
+                SlideSpec("executive_summary", "Key findings in 3-5 bullets"),
+                SlideSpec("situation", "Current state assessment"),
+                SlideSpec("challenges", "Key issues to address"),
+                SlideSpec("options", "Strategic alternatives considered"),
+                SlideSpec("recommendation", "Proposed path forward"),
+                SlideSpec("implementation", "How to execute"),
+                SlideSpec("timeline", "Phased roadmap"),
+                SlideSpec("risks", "Key risks and mitigations"),
+                SlideSpec("next_steps", "Immediate actions required"),
+            )
+        }),
+        "product_overview": MappingProxyType({
             "name": "Product Overview",
             "max_slides": 12,
-            "structure": [
-                {"type": "problem", "purpose": "Customer pain point"},
-                {"type": "solution", "purpose": "Product overview"},
-                {"type": "features", "purpose": "Key capabilities"},
-                {"type": "benefits", "purpose": "Value delivered"},
-                {"type": "use_cases", "purpose": "How customers use it"},
-                {"type": "differentiation", "purpose": "Why choose us"},
-                {"type": "pricing", "purpose": "How it's priced"},
-                {"type": "next_steps", "purpose": "Call to action"},
-            ]
-        },
-        "quarterly_review": {
+            "structure": (
+                SlideSpec("problem", "Customer pain point"),
+                SlideSpec("solution", "Product overview"),
+                SlideSpec("features", "Key capabilities"),
+                SlideSpec("benefits", "Value delivered"),
+                SlideSpec("use_cases", "How customers use it"),
+                SlideSpec("differentiation", "Why choose us"),
+                SlideSpec("pricing", "How it's priced"),
+                SlideSpec("next_steps", "Call to action"),
+            )
+        }),
+        "quarterly_review": MappingProxyType({
             "name": "Quarterly Business Review",
             "max_slides": 15,
-            "structure": [
-                {"type": "executive_summary", "purpose": "Quarter highlights"},
-                {"type": "kpi_performance", "purpose": "Key metrics vs. targets"},
-                {"type": "wins", "purpose": "Major achievements"},
-                {"type": "challenges", "purpose": "Issues encountered"},
-                {"type": "learnings", "purpose": "What we learned"},
-                {"type": "next_quarter", "purpose": "Priorities ahead"},
-                {"type": "asks", "purpose": "Support needed"},
-            ]
-        }
-    }
+            "structure": (
+                SlideSpec("executive_summary", "Quarter highlights"),
+                SlideSpec("kpi_performance", "Key metrics vs. targets"),
+                SlideSpec("wins", "Major achievements"),
+                SlideSpec("challenges", "Issues encountered"),
+                SlideSpec("learnings", "What we learned"),
+                SlideSpec("next_quarter", "Priorities ahead"),
+                SlideSpec("asks", "Support needed"),
+            )
+        })
+    })
+
+    DEFAULT_PRESENTATION_TYPE = "investor_pitch"
+
+    @staticmethod
+    def get_structure_template(presentation_type: str) -> Mapping[str, Any]:
+        """Get the structure template for a type, falling back to the default type."""
+        templates = PromptTemplates.STRUCTURE_TEMPLATES
+        template = templates.get(presentation_type)
+        if template is None:
+            template = templates[PromptTemplates.DEFAULT_PRESENTATION_TYPE]
+        return template
 
     # =========================================================================
     # CONTENT GENERATION PROMPTS
     # =========================================================================
 
-    @staticmethod
-    def get_structure_analysis_prompt(document_content: str, presentation_type: str, max_slides: int) -> str:
-        """Generate prompt for analyzing document and recommending slide structure."""
+    # Prompts are laid out static-first: rules, reference structure and output
+    # format come before any per-call input, so provider prompt caches can reuse
+    # the common prefix across calls. Variable fields always go at the end.
+    # Prompts whose call sends an output schema (full presentation, single slide)
+    # carry no JSON example of their own; the schema describes the shape.
+    # Static heads are memoized per presentation type (STRUCTURE_TEMPLATES is
+    # read-only for that reason).
 
-        template = PromptTemplates.STRUCTURE_TEMPLATES.get(
-            presentation_type,
-            PromptTemplates.STRUCTURE_TEMPLATES["investor_pitch"]
-        )
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def get_structure_analysis_static_prefix(presentation_type: str) -> str:
+        """Get the static (cacheable) head of the structure analysis prompt."""
 
-        return f"""Analyze the following source document and recommend a slide structure.
+        template = PromptTemplates.get_structure_template(presentation_type)
 
-SOURCE DOCUMENT:
-{document_content}
+        return f"""Analyze the source document at the end of this prompt and recommend a slide structure.
 
 PRESENTATION TYPE: {template['name']}
-MAXIMUM SLIDES: {max_slides}
 
 REFERENCE STRUCTURE:
-{chr(10).join([f"- {s['type']}: {s['purpose']}" for s in template['structure']])}
+{_render_reference_structure(presentation_type)}
 
 TASK:
 1. Read the source document carefully
@@ -146,29 +192,25 @@ OUTPUT FORMAT (JSON):
 }}
 
 Only include slides that have supporting content in the source document.
-Do NOT include slides for topics not covered in the source."""
+Do NOT include slides for topics not covered in the source.
+"""
 
     @staticmethod
-    def get_slide_generation_prompt(
-        slide_type: str,
-        source_content: str,
-        slide_number: int,
-        total_slides: int,
-        previous_slide_title: str = None
-    ) -> str:
-        """Generate prompt for creating a single slide's content."""
+    def get_structure_analysis_prompt(document_content: str, presentation_type: str, max_slides: int) -> str:
+        """Generate prompt for analyzing document and recommending slide structure."""
 
-        context = ""
-        if previous_slide_title:
-            context = f"\nPREVIOUS SLIDE TITLE: {previous_slide_title}\nEnsure this slide flows logically from the previous one."
+        prefix = PromptTemplates.get_structure_analysis_static_prefix(presentation_type)
 
-        return f"""Create content for slide {slide_number} of {total_slides}.
+        return f"""{prefix}
+MAXIMUM SLIDES: {max_slides}
 
-SLIDE TYPE: {slide_type}
-{context}
+SOURCE DOCUMENT:
+{document_content}"""
 
-SOURCE CONTENT TO USE:
-{source_content}
+    # Response budget of the per-slide call (part of the slide cache key)
+    SLIDE_GENERATION_MAX_TOKENS = 1024
+
+    SLIDE_GENERATION_STATIC_PREFIX = """Create content for one slide of a presentation.
 
 REQUIREMENTS:
 1. TITLE: Write an insight-driven title (complete sentence, states the "so what")
@@ -182,27 +224,31 @@ REQUIREMENTS:
    - Only use information from the source content
 
 3. NO FABRICATION: If specific numbers aren't in the source, don't invent them
-
-OUTPUT FORMAT (JSON):
-{{
-    "title": "Insight-driven slide title as complete sentence",
-    "bullet_points": [
-        "First supporting point",
-        "Second supporting point",
-        "Third supporting point",
-        "Fourth supporting point (optional)"
-    ],
-    "notes": "Any presenter notes or caveats"
-}}"""
+"""
 
     @staticmethod
-    def get_title_refinement_prompt(draft_title: str, slide_type: str) -> str:
-        """Generate prompt for refining a slide title to be more insight-driven."""
+    def get_slide_generation_prompt(
+        slide_type: str,
+        source_content: str,
+        slide_number: int,
+        total_slides: int,
+        previous_slide_title: str = None
+    ) -> str:
+        """Generate prompt for creating a single slide's content."""
 
-        return f"""Refine this slide title to be more insight-driven.
+        context = ""
+        if previous_slide_title:
+            context = f"\nPREVIOUS SLIDE TITLE: {previous_slide_title}\nEnsure this slide flows logically from the previous one."
 
-CURRENT TITLE: {draft_title}
+        return f"""{PromptTemplates.SLIDE_GENERATION_STATIC_PREFIX}
+SLIDE: {slide_number} of {total_slides}
 SLIDE TYPE: {slide_type}
+{context}
+
+SOURCE CONTENT TO USE:
+{source_content}"""
+
+    TITLE_REFINEMENT_STATIC_PREFIX = """Refine a slide title to be more insight-driven.
 
 RULES FOR GOOD TITLES:
 1. Complete sentence (subject + verb + object)
@@ -222,23 +268,21 @@ GOOD EXAMPLES:
 - "Path to profitability in Year 3 with 180% revenue CAGR"
 
 OUTPUT FORMAT (JSON):
-{{
+{
     "refined_title": "Your improved title here",
     "reasoning": "Brief explanation of improvement"
-}}"""
+}
+"""
 
     @staticmethod
-    def get_bullet_refinement_prompt(bullets: list, title: str) -> str:
-        """Generate prompt for refining bullet points."""
-
-        bullets_text = "\n".join([f"- {b}" for b in bullets])
-
-        return f"""Refine these bullet points to better support the slide title.
+    def get_title_refinement_prompt(draft_title: str, slide_type: str) -> str:
+        """Generate prompt for refining a slide title to be more insight-driven."""
 
-SLIDE TITLE: {title}
+        return f"""{PromptTemplates.TITLE_REFINEMENT_STATIC_PREFIX}
+CURRENT TITLE: {draft_title}
+SLIDE TYPE: {slide_type}"""
 
-CURRENT BULLETS:
-{bullets_text}
+    BULLET_REFINEMENT_STATIC_PREFIX = """Refine bullet points to better support the slide title.
 
 RULES FOR GOOD BULLETS:
 1. Support the title's claim with evidence or detail
@@ -249,7 +293,7 @@ RULES FOR GOOD BULLETS:
 6. 10-20 words per bullet (concise but complete)
 
 OUTPUT FORMAT (JSON):
-{{
+{
     "refined_bullets": [
         "Improved bullet 1",
         "Improved bullet 2",
@@ -257,36 +301,34 @@ OUTPUT FORMAT (JSON):
         "Improved bullet 4 (if needed)"
     ],
     "changes_made": "Brief summary of improvements"
-}}"""
+}
+"""
 
     @staticmethod
-    def get_full_presentation_prompt(
-        document_content: str,
-        presentation_type: str,
-        max_slides: int,
-        audience: str = "investors",
-        duration_minutes: int = 15
-    ) -> str:
-        """Generate prompt for creating an entire presentation at once."""
+    def get_bullet_refinement_prompt(bullets: list, title: str) -> str:
+        """Generate prompt for refining bullet points."""
 
-        template = PromptTemplates.STRUCTURE_TEMPLATES.get(
-            presentation_type,
-            PromptTemplates.STRUCTURE_TEMPLATES["investor_pitch"]
-        )
+        bullets_text = "- " + "\n- ".join(map(str, bullets)) if bullets else ""
 
-        return f"""Create a {max_slides}-slide presentation from the following source document.
+        return f"""{PromptTemplates.BULLET_REFINEMENT_STATIC_PREFIX}
+SLIDE TITLE: {title}
 
-SOURCE DOCUMENT:
-{document_content}
+CURRENT BULLETS:
+{bullets_text}"""
 
-PRESENTATION PARAMETERS:
-- Type: {template['name']}
-- Audience: {audience}
-- Duration: {duration_minutes} minutes (~1 minute per slide)
-- Maximum slides: {max_slides}
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def get_full_presentation_static_prefix(presentation_type: str) -> str:
+        """Get the static (cacheable) head of the full presentation prompt."""
+
+        template = PromptTemplates.get_structure_template(presentation_type)
+
+        return f"""Create a presentation from the source document at the end of this prompt.
+
+PRESENTATION TYPE: {template['name']}
 
 REFERENCE STRUCTURE:
-{chr(10).join([f"- {s['type']}: {s['purpose']}" for s in template['structure']])}
+{_render_reference_structure(presentation_type)}
 
 CRITICAL RULES:
 1. ONLY use information from the source document - NO fabricated statistics or numbers
@@ -323,41 +365,19 @@ Chart annotation types (add to "annotations" array when helpful):
 - leader_line: Points to a specific data point with label
   {{"type": "leader_line", "x": 0.8, "y": 0.9, "text": "Key insight", "direction": "right"}}
 
-OUTPUT FORMAT (JSON):
+Example chart_data object for a slide:
 {{
-    "presentation_title": "Main title for the deck",
-    "subtitle": "Subtitle or company name",
-    "slides": [
-        {{
-            "slide_number": 1,
-            "slide_type": "problem",
-            "title": "Insight-driven title as complete sentence",
-            "bullet_points": [
-                "Supporting point 1",
-                "Supporting point 2",
-                "Supporting point 3"
-            ],
-            "chart_data": {{
-                "type": "column",
-                "title": "Chart Title (Units)",
-                "categories": ["Cat1", "Cat2", "Cat3"],
-                "series": [
-                    {{"name": "Series 1", "values": [10, 20, 30]}},
-                    {{"name": "Series 2", "values": [15, 25, 35]}}
-                ],
-                "highlight_index": 1,
-                "source": "Source: Data source",
-                "annotations": [
-                    {{"type": "cagr_arrow", "series_index": 1, "from_category": 0, "to_category": 2, "label": "50% CAGR"}}
-                ]
-            }}
-        }},
-        {{
-            "slide_number": 2,
-            "slide_type": "situation",
-            "title": "Another insight-driven title",
-            "bullet_points": ["Point 1", "Point 2", "Point 3"]
-        }}
+    "type": "column",
+    "title": "Chart Title (Units)",
+    "categories": ["Cat1", "Cat2", "Cat3"],
+    "series": [
+        {{"name": "Series 1", "values": [10, 20, 30]}},
+        {{"name": "Series 2", "values": [15, 25, 35]}}
+    ],
+    "highlight_index": 1,
+    "source": "Source: Data source",
+    "annotations": [
+        {{"type": "cagr_arrow", "series_index": 1, "from_category": 0, "to_category": 2, "label": "50% CAGR"}}
     ]
 }}
 
@@ -366,5 +386,27 @@ IMPORTANT:
 - Extract EXACT numbers from the source - do not estimate or fabricate
 - Not every slide needs a chart - only include when data visualization adds value
 - For qualitative content, omit the chart_data field entirely
+"""
 
-Generate exactly {max_slides} content slides (title and closing slides will be added automatically)."""
+    @staticmethod
+    def get_full_presentation_prompt(
+        document_content: str,
+        presentation_type: str,
+        max_slides: int,
+        audience: str = "investors",
+        duration_minutes: int = 15
+    ) -> str:
+        """Generate prompt for creating an entire presentation at once."""
+
+        prefix = PromptTemplates.get_full_presentation_static_prefix(presentation_type)
+
+        return f"""{prefix}
+PRESENTATION PARAMETERS:
+- Audience: {audience}
+- Duration: {duration_minutes} minutes (~1 minute per slide)
+- Maximum slides: {max_slides}
+
+Generate exactly {max_slides} content slides (title and closing slides will be added automatically).
+
+SOURCE DOCUMENT:
+{document_content}"""
@@ -0,0 +1,137 @@
+"""
+Slide Prompt Cache for LLAPI
+============================
+
+Caches per-slide LLM responses across runs, keyed on the structural skeleton
+of the slide generation prompt rather than the exact prompt text.
+
+Regenerating a deck for the same company/template produces prompts that
+differ only in their variable slots (slide number, total slides, previous
+slide title). Slide number and total slides are masked out of the key, so a
+slide with the same type and source content is served from cache regardless
+of where it lands in the deck; the cached response carries no slide number.
+The previous slide title stays in the key for chained slides, whose text is
+written to follow on from it.
+
+Everything else that shapes the response (system prompt, full prompt
+template, output schema, token budget) is hashed into every key, so editing
+any of them invalidates old entries instead of serving stale slides. Bump
+CACHE_FORMAT_VERSION for changes the digest cannot see, such as how
+responses are parsed.
+"""
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..models import get_single_slide_draft_json_schema
+from .prompt_templates import PromptTemplates
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "slide_deck_agent" / "slide_prompts.sqlite3"
+
+# Bump to invalidate every cached slide after a change outside the prompt inputs
+CACHE_FORMAT_VERSION = 1
+
+
+def _skeleton_digest() -> str:
+    """Hash every request input shared by all per-slide calls."""
+    # Placeholders stand in for the variable slots, so the digest covers the
+    # template text around them as well as the static head
+    template = PromptTemplates.get_slide_generation_prompt(
+        slide_type="{slide_type}",
+        source_content="{source_content}",
+        slide_number=0,
+        total_slides=0,
+        previous_slide_title="{previous_slide_title}"
+    )
+    schema = json.dumps(get_single_slide_draft_json_schema(), sort_keys=True)
+    parts = [
+        str(CACHE_FORMAT_VERSION),
+        PromptTemplates.SYSTEM_PROMPT,
+        template,
+        schema,
+        str(PromptTemplates.SLIDE_GENERATION_MAX_TOKENS),
+    ]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+class SlidePromptCache:
+    """Persistent cache of generated slide content, stored in SQLite."""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (defaults to ~/.cache/slide_deck_agent/)
+        """
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS slides (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+        # Changing any shared request input invalidates every entry
+        self._skeleton_digest = _skeleton_digest()
+
+    def make_key(
+        self,
+        provider: str,
+        model: Optional[str],
+        slide_type: str,
+        source_content: str,
+        previous_title: Optional[str] = None
+    ) -> str:
+        """
+        Build a cache key from the prompt skeleton.
+
+        Slide number and total slides are deliberately left out of the key.
+
+        Args:
+            provider: LLM provider name
+            model: Model name, if any
+            slide_type: Slide type being generated
+            source_content: Source text for the slide
+            previous_title: Title of the preceding slide, for slides chained
+                            to it (None for independent slides)
+
+        Returns:
+            Hex digest cache key
+        """
+        source_digest = hashlib.sha256(source_content.encode("utf-8")).hexdigest()
+        parts = [self._skeleton_digest, provider, model or "", slide_type, source_digest]
+        if previous_title is not None:
+            # Chained slides are written to follow their predecessor
+            parts.append("previous:" + previous_title)
+        raw_key = "\0".join(parts)
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached slide response, or None on a miss."""
+        row = self._conn.execute(
+            "SELECT response FROM slides WHERE key = ?", (key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, response: Dict[str, Any]):
+        """Store a slide response."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO slides (key, response) VALUES (?, ?)",
+            (key, json.dumps(response))
+        )
+        self._conn.commit()
+
+    def clear(self):
+        """Remove all cached responses."""
+        self._conn.execute("DELETE FROM slides")
+        self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()
@@ -5,22 +5,57 @@ Structure Recommender for LLAPI
 Recommends optimal slide structure based on content analysis.
 """
 
-from typing import List, Dict, Any, Optional
+import re
+from functools import lru_cache
+from typing import List, Dict, Any, Mapping, Tuple
 from .prompt_templates import PromptTemplates
 
 
+@lru_cache(maxsize=64)
+def _compile_keywords(keywords: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile a keyword list into one alternation pattern (substring semantics)."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
 class StructureRecommender:
     """Recommend slide structure based on content and presentation type."""
 
-    def __init__(self):
-        """Initialize the structure recommender."""
-        self.templates = PromptTemplates.STRUCTURE_TEMPLATES
+    # Mapping from slide types to content section keywords. Common mappings
+    # work across presentation types; types not listed match on their own name.
+    _SECTION_MAPPING: Dict[str, List[str]] = {
+        "problem": ["problem", "challenge", "pain", "issue", "current_state"],
+        "solution": ["solution", "approach", "answer", "product", "offering"],
+        "market": ["market", "opportunity", "tam", "sam", "som", "size"],
+        "value_proposition": ["value", "proposition", "differentiator", "benefit", "pillar"],
+        "product": ["product", "feature", "capability", "platform", "service"],
+        "traction": ["traction", "milestone", "achievement", "progress", "roadmap"],
+        "business_model": ["business", "model", "revenue", "monetization", "unit_economics"],
+        "go_to_market": ["go_to_market", "gtm", "distribution", "channel", "launch"],
+        "competition": ["competition", "competitive", "moat", "advantage", "differentiation"],
+        "team": ["team", "founder", "leadership", "experience"],
+        "financials": ["financial", "projection", "forecast", "revenue", "growth"],
+        "ask": ["ask", "raise", "funding", "investment", "use_of_funds"],
+        "vision": ["vision", "future", "mission", "long_term"],
+        "executive_summary": ["executive", "summary", "overview", "key_points"],
+        "situation": ["situation", "context", "background", "current"],
+        "challenges": ["challenge", "issue", "problem", "obstacle"],
+        "options": ["option", "alternative", "scenario", "approach"],
+        "recommendation": ["recommendation", "propose", "suggest", "path"],
+        "implementation": ["implementation", "execute", "plan", "action"],
+        "timeline": ["timeline", "roadmap", "phase", "schedule"],
+        "risks": ["risk", "mitigation", "concern", "challenge"],
+        "next_steps": ["next", "step", "action", "follow_up"],
+    }
+
+    # STRUCTURE_TEMPLATES is read-only, so the recommender holds no per-instance state
+    templates = PromptTemplates.STRUCTURE_TEMPLATES
+    _AVAILABLE_TYPES: Tuple[str, ...] = tuple(PromptTemplates.STRUCTURE_TEMPLATES)
 
     def get_available_types(self) -> List[str]:
         """Get list of available presentation types."""
-        return list(self.templates.keys())
+        return list(self._AVAILABLE_TYPES)
 
-    def get_template(self, presentation_type: str) -> Dict[str, Any]:
+    def get_template(self, presentation_type: str) -> Mapping[str, Any]:
         """
         Get structure template for a presentation type.
 
@@ -28,12 +63,9 @@ class StructureRecommender:
             presentation_type: Type of presentation (e.g., 'investor_pitch')
 
         Returns:
-            Template dictionary with structure information
+            Read-only template mapping with structure information
         """
-        return self.templates.get(
-            presentation_type,
-            self.templates["investor_pitch"]
-        )
+        return PromptTemplates.get_structure_template(presentation_type)
 
     def recommend_structure(
         self,
@@ -59,26 +91,21 @@ class StructureRecommender:
         template = self.get_template(presentation_type)
         recommended = []
 
-        # Map content sections to slide types
-        section_mapping = self._get_section_mapping(presentation_type)
-
-        for slide_spec in template["structure"]:
-            if len(recommended) >= max_slides:
-                break
-
-            slide_type = slide_spec["type"]
+        # Match every slide type against the content sections in one pass
+        slide_specs = template["structure"][:max_slides]
+        matches = self._match_content_sections(
+            [spec.type for spec in slide_specs],
+            content_sections
+        )
 
-            # Find matching content
-            matching_content = self._find_matching_content(
-                slide_type,
-                content_sections,
-                section_mapping
-            )
+        for slide_spec in slide_specs:
+            slide_type = slide_spec.type
+            matching_content = matches.get(slide_type)
 
             if matching_content:
                 recommended.append({
                     "slide_type": slide_type,
-                    "purpose": slide_spec["purpose"],
+                    "purpose": slide_spec.purpose,
                     "source_content": matching_content,
                     "has_content": True
                 })
@@ -86,76 +113,106 @@ class StructureRecommender:
                 # Include in structure but mark as needing content
                 recommended.append({
                     "slide_type": slide_type,
-                    "purpose": slide_spec["purpose"],
+                    "purpose": slide_spec.purpose,
                     "source_content": None,
                     "has_content": False
                 })
 
         return recommended
 
-    def _get_section_mapping(self, presentation_type: str) -> Dict[str, List[str]]:
+    def prepare_document(
+        self,
+        content_sections: Dict[str, str],
+        presentation_type: str = "investor_pitch",
+        token_budget: int = 8000,
+        chars_per_token: int = 4
+    ) -> str:
         """
-        Get mapping from slide types to content section keywords.
+        Reduce a long source document to the sections the deck will use.
+
+        Keeps the introduction plus every section whose name matches a keyword
+        of one of the template's slide types (all sections if none match), in
+        document order, then truncates the result at a line boundary to fit
+        the token budget.
 
         Args:
+            content_sections: Dictionary of section name -> content
             presentation_type: Type of presentation
+            token_budget: Approximate maximum tokens of the returned text
+            chars_per_token: Characters per token used for the estimate
 
         Returns:
-            Dictionary mapping slide types to section name patterns
+            Document text with one "## section" header per kept section
         """
-        # Common mappings that work across presentation types
-        return {
-            "problem": ["problem", "challenge", "pain", "issue", "current_state"],
-            "solution": ["solution", "approach", "answer", "product", "offering"],
-            "market": ["market", "opportunity", "tam", "sam", "som", "size"],
-            "value_proposition": ["value", "proposition", "differentiator", "benefit", "pillar"],
-            "product": ["product", "feature", "capability", "platform", "service"],
-            "traction": ["traction", "milestone", "achievement", "progress", "roadmap"],
-            "business_model": ["business", "model", "revenue", "monetization", "unit_economics"],
-            "go_to_market": ["go_to_market", "gtm", "distribution", "channel", "launch"],
-            "competition": ["competition", "competitive", "moat", "advantage", "differentiation"],
-            "team": ["team", "founder", "leadership", "experience"],
-            "financials": ["financial", "projection", "forecast", "revenue", "growth"],
-            "ask": ["ask", "raise", "funding", "investment", "use_of_funds"],
-            "vision": ["vision", "future", "mission", "long_term"],
-            "executive_summary": ["executive", "summary", "overview", "key_points"],
-            "situation": ["situation", "context", "background", "current"],
-            "challenges": ["challenge", "issue", "problem", "obstacle"],
-            "options": ["option", "alternative", "scenario", "approach"],
-            "recommendation": ["recommendation", "propose", "suggest", "path"],
-            "implementation": ["implementation", "execute", "plan", "action"],
-            "timeline": ["timeline", "roadmap", "phase", "schedule"],
-            "risks": ["risk", "mitigation", "concern", "challenge"],
-            "next_steps": ["next", "step", "action", "follow_up"],
+        template = self.get_template(presentation_type)
+        patterns = [
+            self._keyword_pattern(self._SECTION_MAPPING, spec.type)
+            for spec in template["structure"]
+        ]
+
+        relevant = {
+            name: content for name, content in content_sections.items()
+            if name == "introduction"
+            or any(pattern.search(name.lower()) for pattern in patterns)
         }
+        if not relevant or set(relevant) == {"introduction"}:
+            # Nothing beyond the introduction matched: keep the whole document
+            relevant = content_sections
+
+        document = "\n\n".join(f"## {name}\n{content}" for name, content in relevant.items())
+
+        max_chars = token_budget * chars_per_token
+        if len(document) > max_chars:
+            cut = document.rfind("\n", 0, max_chars)
+            document = document[:cut if cut > 0 else max_chars]
+
+        return document
 
-    def _find_matching_content(
+    def _match_content_sections(
         self,
-        slide_type: str,
-        content_sections: Dict[str, str],
-        section_mapping: Dict[str, List[str]]
-    ) -> Optional[str]:
+        slide_types: List[str],
+        content_sections: Dict[str, str]
+    ) -> Dict[str, str]:
         """
-        Find content that matches a slide type.
+        Find matching content for several slide types at once.
+
+        A section matches a slide type when its lowercased name contains one of
+        the type's keywords from _SECTION_MAPPING (types not listed there use
+        their own name as the only keyword). For each type, the first matching
+        section in document order wins. Each section name is lowercased once
+        and tested against one compiled pattern per type.
 
         Args:
-            slide_type: Type of slide to match
+            slide_types: Slide types to match
             content_sections: Available content sections
-            section_mapping: Mapping from slide types to keywords
 
         Returns:
-            Matching content string or None
+            Dictionary mapping matched slide types to their content
         """
-        keywords = section_mapping.get(slide_type, [slide_type])
+        patterns = {
+            slide_type: self._keyword_pattern(self._SECTION_MAPPING, slide_type)
+            for slide_type in slide_types
+        }
 
+        matches: Dict[str, str] = {}
         for section_name, content in content_sections.items():
+            if len(matches) == len(patterns):
+                break
             section_lower = section_name.lower()
 
-            for keyword in keywords:
-                if keyword in section_lower:
-                    return content
+            for slide_type, pattern in patterns.items():
+                if slide_type not in matches and pattern.search(section_lower):
+                    matches[slide_type] = content
+
+        return matches
 
-        return None
+    @staticmethod
+    def _keyword_pattern(
+        section_mapping: Dict[str, List[str]],
+        slide_type: str
+    ) -> "re.Pattern[str]":
+        """Get the compiled keyword pattern for a slide type."""
+        return _compile_keywords(tuple(section_mapping.get(slide_type, [slide_type])))
 
     def validate_structure(
         self,
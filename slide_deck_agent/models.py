@@ -1,8 +1,9 @@
 """Data models for slide deck generation."""
 
 from enum import Enum
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Literal, TypedDict, Union
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class SlideType(str, Enum):
@@ -28,8 +29,98 @@ class SlideType(str, Enum):
     IMAGE_CAPTION = "standard_content"
 
 
+# Legacy slide type names (as they appear in JSON payloads) resolved with a
+# single dict lookup before enum validation
+_SLIDE_TYPE_ALIASES = {
+    "title_content": SlideType.STANDARD_CONTENT,
+    "two_column": SlideType.STANDARD_CONTENT,
+    "bullet_points": SlideType.STANDARD_CONTENT,
+    "image_caption": SlideType.STANDARD_CONTENT,
+}
+
+
+# =============================================================================
+# CHART DATA SHAPES
+# =============================================================================
+# Typed views of SlideContent.chart_data. Chart data stays a plain dict at
+# runtime: the renderer falls back to defaults for missing keys and to a
+# column chart for unknown types, so partial LLM output still renders.
+
+class ChartSeries(TypedDict, total=False):
+    """One data series of a column chart."""
+    name: str
+    values: List[float]
+
+
+class ChartAnnotation(TypedDict, total=False):
+    """Chart annotation (cagr_arrow, difference_line or leader_line)."""
+    type: Literal["cagr_arrow", "difference_line", "leader_line"]
+    series_index: int
+    from_category: int
+    to_category: int
+    label: str
+    label_generation_request: Dict[str, Any]
+    x: float
+    y: float
+    text: str
+    direction: str
+    position: str
+    line_length: float
+
+
+class ColumnChartData(TypedDict, total=False):
+    """Clustered column chart data."""
+    type: Literal["column"]
+    title: str
+    categories: List[str]
+    series: List[ChartSeries]
+    highlight_index: int
+    color_mode: Literal["comparison"]
+    source: str
+    annotations: List[ChartAnnotation]
+
+
+class WaterfallChartData(TypedDict, total=False):
+    """Waterfall chart data; types are 'start', 'increase', 'decrease' or 'end'."""
+    type: Literal["waterfall"]
+    title: str
+    categories: List[str]
+    values: List[float]
+    types: List[str]
+    source: str
+    annotations: List[ChartAnnotation]
+
+
+class MatrixBubble(TypedDict, total=False):
+    """One bubble of a matrix chart."""
+    label: str
+    x: float
+    y: float
+    size: float
+
+
+class MatrixChartData(TypedDict, total=False):
+    """2x2 matrix (bubble) chart data."""
+    type: Literal["matrix"]
+    title: str
+    bubbles: List[MatrixBubble]
+    source: str
+    annotations: List[ChartAnnotation]
+
+
+ChartData = Union[ColumnChartData, WaterfallChartData, MatrixChartData]
+
+
 class SlideContent(BaseModel):
-    """Content for a single slide."""
+    """
+    Content for a single slide.
+
+    Slides are immutable once built: assigning to a field raises a
+    ValidationError, so use model_copy(update=...) to derive a changed slide.
+    Unknown keys are ignored, as for the other models.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     slide_type: SlideType
     title: Optional[str] = None
@@ -43,9 +134,17 @@ class SlideContent(BaseModel):
     quote_text: Optional[str] = None
     quote_author: Optional[str] = None
     notes: Optional[str] = Field(default=None, description="Speaker notes")
-    chart_data: Optional[Dict[str, Any]] = Field(default=None, description="Chart data with categories and series")
+    chart_data: Optional[Dict[str, Any]] = Field(default=None, description="Chart data (see ChartData for supported shapes)")
     source: Optional[str] = Field(default=None, description="Source attribution for footer")
 
+    @field_validator("slide_type", mode="before")
+    @classmethod
+    def _resolve_legacy_slide_type(cls, value: Any) -> Any:
+        """Map legacy slide type names (e.g. 'bullet_points') to their canonical type."""
+        if isinstance(value, str):
+            return _SLIDE_TYPE_ALIASES.get(value, value)
+        return value
+
 
 class PresentationRequest(BaseModel):
     """
@@ -69,6 +168,8 @@ class PresentationRequest(BaseModel):
 class GenerationResult(BaseModel):
     """Result of presentation generation."""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     output_path: Optional[str] = None
     slide_count: int = 0
@@ -126,7 +227,66 @@ class CAGRLabelRequest(LabelGenerationRequest):
     data_series: List[float] = Field(description="List of values over time")
     cagr_value: float = Field(description="CAGR as a decimal (e.g., 0.31 for 31%)")
 
+    @classmethod
+    def from_series(cls, data_series: List[float]) -> "CAGRLabelRequest":
+        """
+        Build a request with cagr_value computed from the series endpoints.
+
+        CAGR is (end / start) ** (1 / periods) - 1; it is reported as 0 when
+        undefined (fewer than two points or a non-positive start value).
+        """
+        periods = len(data_series) - 1
+        cagr_value = 0.0
+        if periods > 0 and data_series[0] > 0 and data_series[-1] >= 0:
+            cagr_value = (data_series[-1] / data_series[0]) ** (1 / periods) - 1
+        return cls(data_series=data_series, cagr_value=cagr_value)
+
 
 class CAGRLabelResponse(BaseModel):
     """Response containing CAGR label text."""
     label: str = Field(description="The CAGR label (e.g., '4-Year CAGR: +31%')")
+
+
+# =============================================================================
+# LLM PRESENTATION DRAFT MODELS
+# =============================================================================
+# Output schemas for the full-presentation and per-slide prompts. Passed to the
+# provider's structured-output mode so the response is always well-formed JSON.
+
+class DraftSlide(BaseModel):
+    """One slide as drafted by the LLM (slide_type is the structure type, e.g. 'problem')."""
+    slide_number: int
+    slide_type: str
+    title: str
+    bullet_points: List[str] = Field(default_factory=list)
+    chart_data: Optional[Dict[str, Any]] = Field(default=None, description="See ChartData")
+
+
+class PresentationDraft(BaseModel):
+    """Full presentation as drafted by the LLM."""
+    presentation_title: str
+    subtitle: str = ""
+    slides: List[DraftSlide]
+
+
+class SingleSlideDraft(BaseModel):
+    """One slide as drafted by the per-slide prompt."""
+    title: str = Field(description="Insight-driven slide title as a complete sentence")
+    bullet_points: List[str] = Field(default_factory=list, description="3-4 supporting points")
+    notes: str = Field(default="", description="Any presenter notes or caveats")
+
+
+@lru_cache(maxsize=None)
+def get_presentation_draft_json_schema() -> Dict[str, Any]:
+    """Return the PresentationDraft JSON schema, built on first use and then shared.
+
+    Kept out of import time so CLI and mock runs that never call an LLM don't pay for
+    schema generation. Callers must treat the returned dict as read-only.
+    """
+    return PresentationDraft.model_json_schema()
+
+
+@lru_cache(maxsize=None)
+def get_single_slide_draft_json_schema() -> Dict[str, Any]:
+    """Return the SingleSlideDraft JSON schema, built on first use and then shared."""
+    return SingleSlideDraft.model_json_schema()
@@ -1,8 +1,116 @@
 """Skill for analyzing and structuring content for presentations."""
 
-from typing import List, Dict, Any
+import re
+from typing import List, Dict, Any, Iterator
 from ..models import SlideContent, SlideType
 
+# Slide types bound once at import (avoids enum attribute lookups per slide)
+_TITLE = SlideType.TITLE
+_BULLET_POINTS = SlideType.BULLET_POINTS
+_SECTION_HEADER = SlideType.SECTION_HEADER
+_TITLE_CONTENT = SlideType.TITLE_CONTENT
+_TWO_COLUMN = SlideType.TWO_COLUMN
+_QUOTE = SlideType.QUOTE
+_THANK_YOU = SlideType.THANK_YOU
+
+# "- ", "* ", "• ", "→ " bullets, or a digit-led line up to its first ". "
+_BULLET_MARKER_RE = re.compile(r"(?:[-*•→] |\d.*?\. )\s*(.*)", re.DOTALL)
+
+
+# Suggested structure for analyze_topic, built once (without re-running
+# validation, since every field is a trusted literal). Callers get deep copies:
+# SlideContent is frozen, but its bullet_points lists are not.
+_DEFAULT_TEMPLATE = (
+    # Title slide
+    SlideContent.model_construct(
+        slide_type=_TITLE,
+        title="",  # replaced by the topic
+        subtitle="A Comprehensive Overview",
+        notes="Introduction slide - set the stage for the presentation",
+    ),
+
+    # Agenda/Overview
+    SlideContent.model_construct(
+        slide_type=_BULLET_POINTS,
+        title="Agenda",
+        bullet_points=[
+            "Introduction and Background",
+            "Key Concepts and Principles",
+            "Current State and Challenges",
+            "Solutions and Recommendations",
+            "Next Steps and Conclusion",
+        ],
+        notes="Outline what will be covered in the presentation",
+    ),
+
+    # Section: Introduction
+    SlideContent.model_construct(
+        slide_type=_SECTION_HEADER, title="Introduction & Background"
+    ),
+
+    SlideContent.model_construct(
+        slide_type=_TITLE_CONTENT,
+        title="Background",
+        content="Provide context and background information about the topic. "
+        "Explain why this topic is important and relevant to the audience.",
+        notes="Establish foundation and context for the presentation",
+    ),
+
+    # Section: Key Concepts
+    SlideContent.model_construct(slide_type=_SECTION_HEADER, title="Key Concepts"),
+
+    SlideContent.model_construct(
+        slide_type=_TWO_COLUMN,
+        title="Core Principles",
+        left_content="Concept 1:\nExplain the first key concept or principle "
+        "that is fundamental to understanding this topic.",
+        right_content="Concept 2:\nExplain the second key concept or principle "
+        "that complements the first one.",
+        notes="Break down complex concepts into digestible parts",
+    ),
+
+    # Main content slides
+    SlideContent.model_construct(
+        slide_type=_BULLET_POINTS,
+        title="Key Points",
+        bullet_points=[
+            "First important point about the topic",
+            "Second critical aspect to consider",
+            "Third essential element",
+            "Fourth supporting detail",
+        ],
+        notes="Main content - adjust based on your specific topic",
+    ),
+
+    # Quote or insight
+    SlideContent.model_construct(
+        slide_type=_QUOTE,
+        quote_text="Insert a relevant, impactful quote that reinforces your message",
+        quote_author="Author Name",
+        notes="Use quotes to add credibility and emphasize key messages",
+    ),
+
+    # Recommendations/Next Steps
+    SlideContent.model_construct(
+        slide_type=_BULLET_POINTS,
+        title="Next Steps",
+        bullet_points=[
+            "Immediate action item #1",
+            "Short-term goal #2",
+            "Long-term objective #3",
+        ],
+        notes="Clear actionable items for the audience",
+    ),
+
+    # Thank you slide
+    SlideContent.model_construct(
+        slide_type=_THANK_YOU,
+        title="Thank You",
+        subtitle="Questions & Discussion",
+        notes="Open floor for questions and discussion",
+    ),
+)
+
 
 class ContentAnalyzerSkill:
     """Skill for analyzing content and suggesting slide structures."""
@@ -21,116 +129,26 @@ class ContentAnalyzerSkill:
         Returns:
             List of SlideContent objects with suggested structure
         """
-        slides = []
-
-        # Title slide
-        slides.append(
-            SlideContent(
-                slide_type=SlideType.TITLE,
-                title=topic,
-                subtitle="A Comprehensive Overview",
-                notes="Introduction slide - set the stage for the presentation",
-            )
-        )
-
-        # Agenda/Overview
-        slides.append(
-            SlideContent(
-                slide_type=SlideType.BULLET_POINTS,
-                title="Agenda",
-                bullet_points=[
-                    "Introduction and Background",
-                    "Key Concepts and Principles",
-                    "Current State and Challenges",
-                    "Solutions and Recommendations",
-                    "Next Steps and Conclusion",
-                ],
-                notes="Outline what will be covered in the presentation",
-            )
-        )
+        return list(self.iter_topic_slides(topic, num_slides))
 
-        # Section: Introduction
-        slides.append(
-            SlideContent(
-                slide_type=SlideType.SECTION_HEADER, title="Introduction & Background"
-            )
-        )
-
-        slides.append(
-            SlideContent(
-                slide_type=SlideType.TITLE_CONTENT,
-                title="Background",
-                content="Provide context and background information about the topic. "
-                "Explain why this topic is important and relevant to the audience.",
-                notes="Establish foundation and context for the presentation",
-            )
-        )
-
-        # Section: Key Concepts
-        slides.append(SlideContent(slide_type=SlideType.SECTION_HEADER, title="Key Concepts"))
-
-        slides.append(
-            SlideContent(
-                slide_type=SlideType.TWO_COLUMN,
-                title="Core Principles",
-                left_content="Concept 1:\nExplain the first key concept or principle "
-                "that is fundamental to understanding this topic.",
-                right_content="Concept 2:\nExplain the second key concept or principle "
-                "that complements the first one.",
-                notes="Break down complex concepts into digestible parts",
-            )
-        )
-
-        # Main content slides
-        slides.append(
-            SlideContent(
-                slide_type=SlideType.BULLET_POINTS,
-                title="Key Points",
-                bullet_points=[
-                    "First important point about the topic",
-                    "Second critical aspect to consider",
-                    "Third essential element",
-                    "Fourth supporting detail",
-                ],
-                notes="Main content - adjust based on your specific topic",
-            )
-        )
-
-        # Quote or insight
-        slides.append(
-            SlideContent(
-                slide_type=SlideType.QUOTE,
-                quote_text="Insert a relevant, impactful quote that reinforces your message",
-                quote_author="Author Name",
-                notes="Use quotes to add credibility and emphasize key messages",
-            )
-        )
-
-        # Recommendations/Next Steps
-        slides.append(
-            SlideContent(
-                slide_type=SlideType.BULLET_POINTS,
-                title="Next Steps",
-                bullet_points=[
-                    "Immediate action item #1",
-                    "Short-term goal #2",
-                    "Long-term objective #3",
-                ],
-                notes="Clear actionable items for the audience",
-            )
-        )
-
-        # Thank you slide
-        slides.append(
-            SlideContent(
-                slide_type=SlideType.THANK_YOU,
-                title="Thank You",
-                subtitle="Questions & Discussion",
-                notes="Open floor for questions and discussion",
-            )
-        )
+    def iter_topic_slides(self, topic: str, num_slides: int = 10) -> Iterator[SlideContent]:
+        """
+        Lazily yield the suggested slide structure for a topic.
+
+        Args:
+            topic: The presentation topic
+            num_slides: Desired number of slides
 
-        return slides[:num_slides]
+        Yields:
+            SlideContent objects, as analyze_topic would return them
+        """
+        slides = iter(_DEFAULT_TEMPLATE[:num_slides])
+        title_slide = next(slides, None)
+        if title_slide is None:
+            return
+        yield title_slide.model_copy(update={"title": topic})
+        for slide in slides:
+            yield slide.model_copy(deep=True)
 
     def structure_content(self, content_dict: Dict[str, Any]) -> List[SlideContent]:
         """
@@ -142,16 +160,24 @@ class ContentAnalyzerSkill:
         Returns:
             List of SlideContent objects
         """
-        slides = []
+        return list(self.iter_structured_slides(content_dict))
+
+    def iter_structured_slides(self, content_dict: Dict[str, Any]) -> Iterator[SlideContent]:
+        """
+        Lazily structure raw content into slides.
 
+        Args:
+            content_dict: Dictionary with content sections and data
+
+        Yields:
+            SlideContent objects, in the order structure_content returns them
+        """
         # Title
         if "title" in content_dict:
-            slides.append(
-                SlideContent(
-                    slide_type=SlideType.TITLE,
-                    title=content_dict["title"],
-                    subtitle=content_dict.get("subtitle"),
-                )
+            yield SlideContent(
+                slide_type=_TITLE,
+                title=content_dict["title"],
+                subtitle=content_dict.get("subtitle"),
             )
 
         # Sections
@@ -159,42 +185,30 @@ class ContentAnalyzerSkill:
             for section in content_dict["sections"]:
                 # Section header
                 if section.get("header"):
-                    slides.append(
-                        SlideContent(
-                            slide_type=SlideType.SECTION_HEADER, title=section["header"]
-                        )
-                    )
+                    yield SlideContent(slide_type=_SECTION_HEADER, title=section["header"])
 
                 # Section content
                 if section.get("bullets"):
-                    slides.append(
-                        SlideContent(
-                            slide_type=SlideType.BULLET_POINTS,
-                            title=section.get("title"),
-                            bullet_points=section["bullets"],
-                        )
+                    yield SlideContent(
+                        slide_type=_BULLET_POINTS,
+                        title=section.get("title"),
+                        bullet_points=section["bullets"],
                     )
                 elif section.get("content"):
-                    slides.append(
-                        SlideContent(
-                            slide_type=SlideType.TITLE_CONTENT,
-                            title=section.get("title"),
-                            content=section["content"],
-                        )
+                    yield SlideContent(
+                        slide_type=_TITLE_CONTENT,
+                        title=section.get("title"),
+                        content=section["content"],
                     )
 
         # Closing
         if content_dict.get("closing"):
-            slides.append(
-                SlideContent(
-                    slide_type=SlideType.THANK_YOU,
-                    title=content_dict["closing"].get("title", "Thank You"),
-                    subtitle=content_dict["closing"].get("subtitle"),
-                )
+            yield SlideContent(
+                slide_type=_THANK_YOU,
+                title=content_dict["closing"].get("title", "Thank You"),
+                subtitle=content_dict["closing"].get("subtitle"),
             )
 
-        return slides
-
     def split_long_content(self, content: str, max_chars: int = 500) -> List[str]:
         """
         Split long content into multiple slides.
@@ -208,18 +222,22 @@ class ContentAnalyzerSkill:
         """
         sentences = content.split(". ")
         chunks = []
-        current_chunk = ""
+        # Accumulate parts and join once per chunk (repeated += is quadratic)
+        current_parts: List[str] = []
+        current_len = 0
 
         for sentence in sentences:
-            if len(current_chunk) + len(sentence) < max_chars:
-                current_chunk += sentence + ". "
+            if current_len + len(sentence) < max_chars:
+                current_parts.append(sentence)
+                current_len += len(sentence) + 2
             else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = sentence + ". "
+                if current_parts:
+                    chunks.append((". ".join(current_parts) + ". ").strip())
+                current_parts = [sentence]
+                current_len = len(sentence) + 2
 
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        if current_parts:
+            chunks.append((". ".join(current_parts) + ". ").strip())
 
         return chunks
 
@@ -233,18 +251,14 @@ class ContentAnalyzerSkill:
         Returns:
             List of bullet point strings
         """
-        lines = text.split("\n")
         bullets = []
 
-        for line in lines:
+        for line in text.split("\n"):
             line = line.strip()
-            # Remove common bullet point markers
-            if line.startswith(("- ", "* ", "• ", "→ ")):
-                bullets.append(line[2:].strip())
-            elif line and line[0].isdigit() and ". " in line:
-                # Handle numbered lists
-                bullets.append(line.split(". ", 1)[1].strip())
-            elif line:
-                bullets.append(line)
+            if not line:
+                continue
+            # Remove common bullet point markers and numbered-list prefixes
+            match = _BULLET_MARKER_RE.match(line)
+            bullets.append(match.group(1) if match else line)
 
         return [b for b in bullets if b]  # Remove empty strings
@@ -1,9 +1,32 @@
 """Skill for optimizing presentation design and aesthetics."""
 
+import re
+from functools import lru_cache
 from typing import Dict, Tuple, List
 from ..models import PresentationRequest
 
 
+def _srgb_to_linear(channel: int) -> float:
+    """Convert an 8-bit sRGB channel to linear RGB."""
+    c = channel / 255.0
+    return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+
+
+# Linear RGB value for every 8-bit channel value
+_SRGB_TO_LINEAR = tuple(_srgb_to_linear(channel) for channel in range(256))
+
+
+@lru_cache(maxsize=256)
+def _relative_luminance(hex_color: str) -> float:
+    """Calculate WCAG relative luminance of a hex color (cached per color)."""
+    r, g, b = bytes.fromhex(hex_color.lstrip("#")[:6])
+    return (
+        0.2126 * _SRGB_TO_LINEAR[r]
+        + 0.7152 * _SRGB_TO_LINEAR[g]
+        + 0.0722 * _SRGB_TO_LINEAR[b]
+    )
+
+
 class DesignOptimizerSkill:
     """Skill for optimizing presentation design and color schemes."""
 
@@ -67,6 +90,23 @@ class DesignOptimizerSkill:
         },
     }
 
+    # Topic keywords -> suggested scheme, in priority order
+    _TOPIC_SCHEME_RULES = tuple(
+        (re.compile("|".join(map(re.escape, keywords))), scheme_name)
+        for keywords, scheme_name in (
+            # Technology/Innovation
+            (["tech", "ai", "digital", "software", "innovation"], "modern_tech"),
+            # Finance/Business
+            (["business", "finance", "corporate", "strategy"], "corporate_blue"),
+            # Environment/Sustainability
+            (["environment", "sustainability", "green", "eco", "nature"], "professional_green"),
+            # Creative/Design
+            (["creative", "design", "art", "marketing"], "vibrant_creative"),
+            # Education/Research
+            (["education", "research", "academic", "science"], "minimalist_gray"),
+        )
+    )
+
     def apply_color_scheme(
         self, request: PresentationRequest, scheme_name: str = "corporate_blue"
     ) -> PresentationRequest:
@@ -101,32 +141,10 @@ class DesignOptimizerSkill:
         """
         topic_lower = topic.lower()
 
-        # Technology/Innovation
-        if any(
-            word in topic_lower for word in ["tech", "ai", "digital", "software", "innovation"]
-        ):
-            return "modern_tech"
-
-        # Finance/Business
-        if any(
-            word in topic_lower for word in ["business", "finance", "corporate", "strategy"]
-        ):
-            return "corporate_blue"
-
-        # Environment/Sustainability
-        if any(
-            word in topic_lower
-            for word in ["environment", "sustainability", "green", "eco", "nature"]
-        ):
-            return "professional_green"
-
-        # Creative/Design
-        if any(word in topic_lower for word in ["creative", "design", "art", "marketing"]):
-            return "vibrant_creative"
-
-        # Education/Research
-        if any(word in topic_lower for word in ["education", "research", "academic", "science"]):
-            return "minimalist_gray"
+        # First matching category wins (substring match, checked in order)
+        for pattern, scheme_name in self._TOPIC_SCHEME_RULES:
+            if pattern.search(topic_lower):
+                return scheme_name
 
         # Default
         return "corporate_blue"
@@ -159,15 +177,7 @@ class DesignOptimizerSkill:
 
     def _calculate_luminance(self, hex_color: str) -> float:
         """Calculate relative luminance of a color."""
-        hex_color = hex_color.lstrip("#")
-        r, g, b = [int(hex_color[i : i + 2], 16) / 255.0 for i in (0, 2, 4)]
-
-        # Convert to linear RGB
-        r = r / 12.92 if r <= 0.03928 else ((r + 0.055) / 1.055) ** 2.4
-        g = g / 12.92 if g <= 0.03928 else ((g + 0.055) / 1.055) ** 2.4
-        b = b / 12.92 if b <= 0.03928 else ((b + 0.055) / 1.055) ** 2.4
-
-        return 0.2126 * r + 0.7152 * g + 0.0722 * b
+        return _relative_luminance(hex_color)
 
     def _contrast_ratio(self, lum1: float, lum2: float) -> float:
         """Calculate contrast ratio between two luminance values."""
@@ -0,0 +1,34 @@
+"""Helpers shared by the slide generators for working with python-pptx packages."""
+
+from pptx.opc.packuri import PackURI
+
+
+def cache_next_partname(package):
+    """
+    Make package.next_partname O(1) for a package that is only being appended to.
+
+    python-pptx finds the next chart/embedding partname by walking every part in
+    the package, so a deck with N charts costs O(N^2). Here the first lookup per
+    template scans once for the highest existing index, and later ones continue
+    the counter from there, since each returned partname is immediately used
+    for a new part. Unlike python-pptx, gaps left in the template's numbering
+    are not refilled: a counter seeded from the first gap would later hand out
+    partnames that already exist.
+
+    Args:
+        package: The presentation's OpcPackage (prs.part.package)
+    """
+    last_idx = {}
+
+    def next_partname(tmpl):
+        idx = last_idx.get(tmpl)
+        if idx is None:
+            idx = max(
+                (part.partname.idx for part in package.iter_parts()
+                 if part.partname.idx is not None and part.partname == tmpl % part.partname.idx),
+                default=0
+            )
+        last_idx[tmpl] = idx = idx + 1
+        return PackURI(tmpl % idx)
+
+    package.next_partname = next_partname
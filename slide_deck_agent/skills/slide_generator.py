@@ -1,13 +1,79 @@
 """Core skill for generating PowerPoint slides."""
 
+import io
+from copy import deepcopy
+from functools import lru_cache
 from typing import Optional, List
 from pathlib import Path
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 
 from ..models import SlideContent, SlideType, PresentationRequest, GenerationResult
+from .pptx_utils import cache_next_partname
+
+
+# Layout geometry, built once at import. Boxes are (left, top, width, height).
+_SLIDE_WIDTH = Inches(10)
+_SLIDE_HEIGHT = Inches(7.5)
+_STANDARD_TITLE_BOX = (Inches(0.5), Inches(0.5), Inches(9), Inches(0.8))
+_TITLE_RULE_BOX = (Inches(0.5), Inches(1.4), Inches(9), Inches(0.02))
+_BODY_BOX = (Inches(0.7), Inches(2), Inches(8.6), Inches(5))
+_HERO_TITLE_BOX = (Inches(1), Inches(2.5), Inches(8), Inches(1.5))
+_HERO_SUBTITLE_BOX = (Inches(1), Inches(4.2), Inches(8), Inches(1))
+_CENTERED_TITLE_BOX = (Inches(1), Inches(3), Inches(8), Inches(1.5))
+_CLOSING_SUBTITLE_BOX = (Inches(1), Inches(5), Inches(8), Inches(0.8))
+_QUOTE_BOX = (Inches(1.5), Inches(2.5), Inches(7), Inches(2))
+_QUOTE_AUTHOR_BOX = (Inches(1.5), Inches(5), Inches(7), Inches(0.5))
+
+# Font sizes and spacing
+_HERO_TITLE_SIZE = Pt(54)
+_SECTION_TITLE_SIZE = Pt(48)
+_STANDARD_TITLE_SIZE = Pt(36)
+_QUOTE_SIZE = Pt(28)
+_HERO_SUBTITLE_SIZE = Pt(24)
+_SUPPORTING_TEXT_SIZE = Pt(20)  # Quote author, closing subtitle
+_BODY_SIZE = Pt(18)
+_PARAGRAPH_SPACING = Pt(12)
+
+# Fixed text colors on colored backgrounds
+_WHITE = RGBColor(255, 255, 255)
+_SUBTITLE_GREY = RGBColor(230, 230, 230)
+
+# Solid slide background, as python-pptx writes it via background.fill.solid()
+_SOLID_BACKGROUND_XML = (
+    '<p:bg %s><p:bgPr><a:solidFill><a:srgbClr val="%%s"/></a:solidFill>'
+    '<a:effectLst/></p:bgPr></p:bg>' % nsdecls('p', 'a')
+)
+
+
+@lru_cache(maxsize=64)
+def _hex_to_rgb(hex_color: str) -> RGBColor:
+    """
+    Convert hex color to RGBColor.
+
+    A deck uses the same few request colors on every slide, so each string is
+    parsed once. RGBColor is immutable, so the cached value is safe to share.
+    """
+    hex_color = hex_color.lstrip("#")
+    return RGBColor(
+        int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
+    )
+
+
+@lru_cache(maxsize=16)
+def _solid_background(color: RGBColor):
+    """
+    Parsed <p:bg> element filling a slide with one color.
+
+    Title, section and closing slides share one or two background colors per
+    deck, so each is parsed once and deep-copied onto every slide using it.
+    Callers must copy the returned element, never insert it directly.
+    """
+    return parse_xml(_SOLID_BACKGROUND_XML % (color,))
 
 
 class SlideGeneratorSkill:
@@ -16,6 +82,7 @@ class SlideGeneratorSkill:
     def __init__(self):
         """Initialize the slide generator skill."""
         self.prs: Optional[Presentation] = None
+        self._blank_layout = None
 
     def create_presentation(self, request: PresentationRequest) -> GenerationResult:
         """
@@ -28,9 +95,18 @@ class SlideGeneratorSkill:
             GenerationResult with success status and metadata
         """
         try:
+            # Resolve the output directory first so a bad path fails before any
+            # slides are built
+            output_path = Path(request.output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
             self.prs = Presentation()
-            self.prs.slide_width = Inches(10)
-            self.prs.slide_height = Inches(7.5)
+            # Notes slide partnames otherwise rescan the whole package per slide
+            cache_next_partname(self.prs.part.package)
+            # Every slide uses the blank layout; look it up once per presentation
+            self._blank_layout = self.prs.slide_layouts[6]
+            self.prs.slide_width = _SLIDE_WIDTH
+            self.prs.slide_height = _SLIDE_HEIGHT
 
             # Set metadata
             if request.author:
@@ -43,10 +119,12 @@ class SlideGeneratorSkill:
             for slide_content in request.slides:
                 self._add_slide(slide_content, request)
 
-            # Save presentation
-            output_path = Path(request.output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            self.prs.save(str(output_path))
+            # Save presentation: zip into memory and write the file in one call
+            # (zipfile otherwise issues many small writes and seeks), which also
+            # avoids leaving a truncated file behind if serialization fails
+            buffer = io.BytesIO()
+            self.prs.save(buffer)
+            output_path.write_bytes(buffer.getvalue())
 
             return GenerationResult(
                 success=True,
@@ -66,254 +144,204 @@ class SlideGeneratorSkill:
 
     def _add_slide(self, content: SlideContent, request: PresentationRequest):
         """Add a slide based on its type."""
-        if content.slide_type == SlideType.TITLE:
-            self._add_title_slide(content, request)
-        elif content.slide_type == SlideType.TITLE_CONTENT:
-            self._add_title_content_slide(content, request)
-        elif content.slide_type == SlideType.SECTION_HEADER:
-            self._add_section_header_slide(content, request)
-        elif content.slide_type == SlideType.TWO_COLUMN:
-            self._add_two_column_slide(content, request)
-        elif content.slide_type == SlideType.BULLET_POINTS:
-            self._add_bullet_points_slide(content, request)
-        elif content.slide_type == SlideType.QUOTE:
-            self._add_quote_slide(content, request)
-        elif content.slide_type == SlideType.THANK_YOU:
-            self._add_thank_you_slide(content, request)
+        builder = self._SLIDE_BUILDERS.get(content.slide_type)
+        if builder is not None:
+            builder(self, content, request)
         else:
             self._add_blank_slide()
 
     def _add_title_slide(self, content: SlideContent, request: PresentationRequest):
         """Add a title slide."""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])  # Blank layout
+        slide = self.prs.slides.add_slide(self._blank_layout)  # Blank layout
 
         # Add background color
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = self._hex_to_rgb(request.primary_color)
+        self._fill_background(slide, request.primary_color)
 
         # Title
-        left = Inches(1)
-        top = Inches(2.5)
-        width = Inches(8)
-        height = Inches(1.5)
-
-        title_box = slide.shapes.add_textbox(left, top, width, height)
+        title_box = slide.shapes.add_textbox(*_HERO_TITLE_BOX)
         title_frame = title_box.text_frame
         title_frame.word_wrap = True
 
         p = title_frame.paragraphs[0]
         p.text = content.title or "Untitled Presentation"
         p.alignment = PP_ALIGN.CENTER
-        p.font.size = Pt(54)
+        p.font.size = _HERO_TITLE_SIZE
         p.font.bold = True
-        p.font.color.rgb = RGBColor(255, 255, 255)
+        p.font.color.rgb = _WHITE
 
         # Subtitle
         if content.subtitle:
-            subtitle_top = Inches(4.2)
-            subtitle_box = slide.shapes.add_textbox(left, subtitle_top, width, Inches(1))
+            subtitle_box = slide.shapes.add_textbox(*_HERO_SUBTITLE_BOX)
             subtitle_frame = subtitle_box.text_frame
 
             p = subtitle_frame.paragraphs[0]
             p.text = content.subtitle
             p.alignment = PP_ALIGN.CENTER
-            p.font.size = Pt(24)
-            p.font.color.rgb = RGBColor(230, 230, 230)
+            p.font.size = _HERO_SUBTITLE_SIZE
+            p.font.color.rgb = _SUBTITLE_GREY
+
+        self._add_notes(slide, content.notes)
+
+    def _fill_background(self, slide, color: str):
+        """
+        Give a slide a solid background color.
+
+        Args:
+            slide: Freshly added slide (blank layout, no background yet)
+            color: Hex color for the background
+        """
+        slide._element.cSld.insert(0, deepcopy(_solid_background(self._hex_to_rgb(color))))
+
+    @staticmethod
+    def _add_notes(slide, notes: Optional[str]):
+        """
+        Add speaker notes to a slide.
 
-        # Add speaker notes if provided
-        if content.notes:
-            notes_slide = slide.notes_slide
-            text_frame = notes_slide.notes_text_frame
-            text_frame.text = content.notes
+        Reading slide.notes_slide creates the notes part, so it is only touched
+        when there is text to put in it.
+
+        Args:
+            slide: Slide to annotate
+            notes: Speaker notes text, or None
+        """
+        if notes:
+            slide.notes_slide.notes_text_frame.text = notes
+
+    def _add_standard_title(self, slide, text: str, color: str):
+        """
+        Add the bold 36pt title box used at the top of content slides.
+
+        Args:
+            slide: Slide to add the title to
+            text: Title text
+            color: Hex color for the title text
+        """
+        title_box = slide.shapes.add_textbox(*_STANDARD_TITLE_BOX)
+        p = title_box.text_frame.paragraphs[0]
+        p.text = text
+        font = p.font
+        font.size = _STANDARD_TITLE_SIZE
+        font.bold = True
+        font.color.rgb = self._hex_to_rgb(color)
 
     def _add_title_content_slide(self, content: SlideContent, request: PresentationRequest):
         """Add a title and content slide."""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
 
         # Title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(0.8))
-        title_frame = title_box.text_frame
-        p = title_frame.paragraphs[0]
-        p.text = content.title or ""
-        p.font.size = Pt(36)
-        p.font.bold = True
-        p.font.color.rgb = self._hex_to_rgb(request.primary_color)
+        self._add_standard_title(slide, content.title or "", request.primary_color)
 
         # Add line under title
-        line = slide.shapes.add_shape(
-            1, Inches(0.5), Inches(1.4), Inches(9), Inches(0.02)  # Line shape
-        )
+        line = slide.shapes.add_shape(1, *_TITLE_RULE_BOX)  # Line shape
         line.fill.solid()
         line.fill.fore_color.rgb = self._hex_to_rgb(request.secondary_color)
         line.line.fill.background()
 
         # Content
-        content_box = slide.shapes.add_textbox(Inches(0.7), Inches(2), Inches(8.6), Inches(5))
+        content_box = slide.shapes.add_textbox(*_BODY_BOX)
         content_frame = content_box.text_frame
         content_frame.word_wrap = True
         content_frame.vertical_anchor = MSO_ANCHOR.TOP
 
         p = content_frame.paragraphs[0]
         p.text = content.content or ""
-        p.font.size = Pt(18)
+        p.font.size = _BODY_SIZE
         p.font.color.rgb = self._hex_to_rgb(request.text_color)
-        p.space_after = Pt(12)
+        p.space_after = _PARAGRAPH_SPACING
 
-        if content.notes:
-            notes_slide = slide.notes_slide
-            text_frame = notes_slide.notes_text_frame
-            text_frame.text = content.notes
+        self._add_notes(slide, content.notes)
 
     def _add_section_header_slide(self, content: SlideContent, request: PresentationRequest):
         """Add a section header slide."""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
 
         # Background
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = self._hex_to_rgb(request.secondary_color)
+        self._fill_background(slide, request.secondary_color)
 
         # Section title
-        title_box = slide.shapes.add_textbox(Inches(1), Inches(3), Inches(8), Inches(1.5))
+        title_box = slide.shapes.add_textbox(*_CENTERED_TITLE_BOX)
         title_frame = title_box.text_frame
 
         p = title_frame.paragraphs[0]
         p.text = content.title or ""
         p.alignment = PP_ALIGN.CENTER
-        p.font.size = Pt(48)
-        p.font.bold = True
-        p.font.color.rgb = RGBColor(255, 255, 255)
-
-    def _add_two_column_slide(self, content: SlideContent, request: PresentationRequest):
-        """Add a two-column slide."""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
-
-        # Title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(0.8))
-        title_frame = title_box.text_frame
-        p = title_frame.paragraphs[0]
-        p.text = content.title or ""
-        p.font.size = Pt(36)
-        p.font.bold = True
-        p.font.color.rgb = self._hex_to_rgb(request.primary_color)
-
-        # Left column
-        left_box = slide.shapes.add_textbox(Inches(0.7), Inches(2), Inches(4.1), Inches(5))
-        left_frame = left_box.text_frame
-        left_frame.word_wrap = True
-        p = left_frame.paragraphs[0]
-        p.text = content.left_content or ""
-        p.font.size = Pt(16)
-        p.font.color.rgb = self._hex_to_rgb(request.text_color)
-
-        # Right column
-        right_box = slide.shapes.add_textbox(Inches(5.2), Inches(2), Inches(4.1), Inches(5))
-        right_frame = right_box.text_frame
-        right_frame.word_wrap = True
-        p = right_frame.paragraphs[0]
-        p.text = content.right_content or ""
-        p.font.size = Pt(16)
-        p.font.color.rgb = self._hex_to_rgb(request.text_color)
-
-    def _add_bullet_points_slide(self, content: SlideContent, request: PresentationRequest):
-        """Add a bullet points slide."""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
-
-        # Title
-        title_box = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(0.8))
-        title_frame = title_box.text_frame
-        p = title_frame.paragraphs[0]
-        p.text = content.title or ""
-        p.font.size = Pt(36)
+        p.font.size = _SECTION_TITLE_SIZE
         p.font.bold = True
-        p.font.color.rgb = self._hex_to_rgb(request.primary_color)
+        p.font.color.rgb = _WHITE
 
-        # Bullet points
-        content_box = slide.shapes.add_textbox(Inches(0.7), Inches(2), Inches(8.6), Inches(5))
-        content_frame = content_box.text_frame
-        content_frame.word_wrap = True
-
-        if content.bullet_points:
-            for i, bullet in enumerate(content.bullet_points):
-                if i == 0:
-                    p = content_frame.paragraphs[0]
-                else:
-                    p = content_frame.add_paragraph()
-
-                p.text = bullet
-                p.level = 0
-                p.font.size = Pt(20)
-                p.font.color.rgb = self._hex_to_rgb(request.text_color)
-                p.space_after = Pt(12)
+        self._add_notes(slide, content.notes)
 
     def _add_quote_slide(self, content: SlideContent, request: PresentationRequest):
         """Add a quote slide."""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
 
         # Quote text
-        quote_box = slide.shapes.add_textbox(Inches(1.5), Inches(2.5), Inches(7), Inches(2))
+        quote_box = slide.shapes.add_textbox(*_QUOTE_BOX)
         quote_frame = quote_box.text_frame
         quote_frame.word_wrap = True
 
         p = quote_frame.paragraphs[0]
         p.text = f'"{content.quote_text}"' if content.quote_text else ""
         p.alignment = PP_ALIGN.CENTER
-        p.font.size = Pt(28)
+        p.font.size = _QUOTE_SIZE
         p.font.italic = True
         p.font.color.rgb = self._hex_to_rgb(request.text_color)
 
         # Author
         if content.quote_author:
-            author_box = slide.shapes.add_textbox(Inches(1.5), Inches(5), Inches(7), Inches(0.5))
+            author_box = slide.shapes.add_textbox(*_QUOTE_AUTHOR_BOX)
             author_frame = author_box.text_frame
             p = author_frame.paragraphs[0]
             p.text = f"— {content.quote_author}"
             p.alignment = PP_ALIGN.CENTER
-            p.font.size = Pt(20)
+            p.font.size = _SUPPORTING_TEXT_SIZE
             p.font.color.rgb = self._hex_to_rgb(request.secondary_color)
 
+        self._add_notes(slide, content.notes)
+
     def _add_thank_you_slide(self, content: SlideContent, request: PresentationRequest):
         """Add a thank you slide."""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
 
         # Background
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = self._hex_to_rgb(request.primary_color)
+        self._fill_background(slide, request.primary_color)
 
         # Thank you text
-        text_box = slide.shapes.add_textbox(Inches(1), Inches(3), Inches(8), Inches(1.5))
+        text_box = slide.shapes.add_textbox(*_CENTERED_TITLE_BOX)
         text_frame = text_box.text_frame
 
         p = text_frame.paragraphs[0]
         p.text = content.title or "Thank You"
         p.alignment = PP_ALIGN.CENTER
-        p.font.size = Pt(54)
+        p.font.size = _HERO_TITLE_SIZE
         p.font.bold = True
-        p.font.color.rgb = RGBColor(255, 255, 255)
+        p.font.color.rgb = _WHITE
 
         # Subtitle (e.g., contact info)
         if content.subtitle:
-            subtitle_box = slide.shapes.add_textbox(Inches(1), Inches(5), Inches(8), Inches(0.8))
+            subtitle_box = slide.shapes.add_textbox(*_CLOSING_SUBTITLE_BOX)
             subtitle_frame = subtitle_box.text_frame
             p = subtitle_frame.paragraphs[0]
             p.text = content.subtitle
             p.alignment = PP_ALIGN.CENTER
-            p.font.size = Pt(20)
-            p.font.color.rgb = RGBColor(230, 230, 230)
+            p.font.size = _SUPPORTING_TEXT_SIZE
+            p.font.color.rgb = _SUBTITLE_GREY
+
+        self._add_notes(slide, content.notes)
 
     def _add_blank_slide(self):
         """Add a blank slide."""
-        self.prs.slides.add_slide(self.prs.slide_layouts[6])
-
-    @staticmethod
-    def _hex_to_rgb(hex_color: str) -> RGBColor:
-        """Convert hex color to RGBColor."""
-        hex_color = hex_color.lstrip("#")
-        return RGBColor(
-            int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
-        )
+        self.prs.slides.add_slide(self._blank_layout)
+
+    _hex_to_rgb = staticmethod(_hex_to_rgb)
+
+    # Slide type -> builder. SlideType is a str enum, so raw type strings hit
+    # the same entries. The legacy TITLE_CONTENT / TWO_COLUMN / BULLET_POINTS
+    # names are aliases of STANDARD_CONTENT and render as title-content slides.
+    _SLIDE_BUILDERS = {
+        SlideType.TITLE: _add_title_slide,
+        SlideType.STANDARD_CONTENT: _add_title_content_slide,
+        SlideType.SECTION_HEADER: _add_section_header_slide,
+        SlideType.QUOTE: _add_quote_slide,
+        SlideType.THANK_YOU: _add_thank_you_slide,
+    }
@@ -18,6 +18,9 @@ Usage:
     title_region = MAIN_CONFIG['grid']['regions']['title']
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
@@ -29,8 +32,9 @@ from pptx.dml.color import RGBColor
 # Reference resolution: 1920×1080 at 144 DPI
 DPI = 144
 
+@lru_cache(maxsize=256)
 def px_to_inches(px):
-    """Convert pixels to inches at 144 DPI"""
+    """Convert pixels to inches at 144 DPI (cached: callers reuse a few grid constants)"""
     return Inches(px / DPI)
 
 CANVAS = {
@@ -304,6 +308,14 @@ COLORS = {
     'seq_shade_4_rgb': (162, 218, 217)
 }
 
+# Palette as shared RGBColor instances keyed by base name ('primary_green', ...),
+# built once so renderers index it instead of converting per shape
+COLORS_RGBCOLOR = {
+    name[:-len('_rgb')]: RGBColor(*rgb)
+    for name, rgb in COLORS.items()
+    if name.endswith('_rgb')
+}
+
 SEQUENTIAL_PALETTE = [
     COLORS['seq_shade_1'],
     COLORS['seq_shade_2'],
@@ -854,10 +866,67 @@ MAIN_CONFIG = {
     'rendering_rules': RENDERING_RULES
 }
 
+
+def _freeze(value, memo):
+    """Recursively wrap nested dicts in read-only views, keeping shared sub-dicts shared"""
+    if not isinstance(value, dict):
+        return value
+    frozen = memo.get(id(value))
+    if frozen is None:
+        frozen = memo[id(value)] = MappingProxyType(
+            {key: _freeze(item, memo) for key, item in value.items()}
+        )
+    return frozen
+
+
+# The configuration is static: freeze it once and rebind every module-level
+# table to its frozen view, so MAIN_CONFIG paths and direct names agree.
+# Use config_to_dict() for a mutable copy (copy.deepcopy and json.dumps do not
+# accept mappingproxy).
+MAIN_CONFIG = _freeze(MAIN_CONFIG, {})
+GRID_SYSTEM = MAIN_CONFIG['grid']
+CANVAS = GRID_SYSTEM['canvas']
+SAFE_ZONE = GRID_SYSTEM['safe_zone']
+REGIONS = GRID_SYSTEM['regions']
+TYPOGRAPHY = MAIN_CONFIG['typography']
+TYPOGRAPHY_SPECIAL = MAIN_CONFIG['typography_special']
+COLORS = MAIN_CONFIG['colors']
+COLORS_RGBCOLOR = MappingProxyType(COLORS_RGBCOLOR)  # kept out of MAIN_CONFIG: not deep-copyable
+STORY_DRIVEN_COLORS = MAIN_CONFIG['story_driven_colors']
+FONTS = MAIN_CONFIG['fonts']
+LAYOUT_DISTRIBUTION = MAIN_CONFIG['layout_distribution']
+CHART_COLUMN = MAIN_CONFIG['charts']['column']
+CHART_MATRIX = MAIN_CONFIG['charts']['matrix']
+CHART_WATERFALL = MAIN_CONFIG['charts']['waterfall']
+TEXT_BULLETED_LIST = MAIN_CONFIG['text_components']['bulleted_list']
+CALLOUT_BOX = MAIN_CONFIG['text_components']['callout_box']
+SLIDE_BLUEPRINTS = MAIN_CONFIG['slide_blueprints']
+RENDERING_RULES = MAIN_CONFIG['rendering_rules']
+
 # ============================================================================
 # 8.0 HELPER FUNCTIONS
 # ============================================================================
 
+def config_to_dict(config=None):
+    """
+    Return a mutable deep copy of a frozen configuration as plain dicts and lists.
+
+    Args:
+        config: Frozen mapping to copy (defaults to the whole MAIN_CONFIG)
+
+    Returns:
+        Plain nested dicts, suitable for copy.deepcopy, json.dumps or customizing
+    """
+    return _thaw(MAIN_CONFIG if config is None else config)
+
+def _thaw(value):
+    """Recursively copy read-only views and lists into plain dicts and lists"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_thaw(item) for item in value]
+    return value
+
 def get_safe_zone_bounds():
     """Get Safe Zone boundary coordinates"""
     return SAFE_ZONE
@@ -878,6 +947,12 @@ def get_slide_blueprint(slide_type):
     """Get slide blueprint specification by type"""
     return SLIDE_BLUEPRINTS.get(slide_type)
 
+# Safe Zone corners in pixels, bound once for validate_bounds
+_SZ_X0 = SAFE_ZONE['top_left']['x_px']
+_SZ_Y0 = SAFE_ZONE['top_left']['y_px']
+_SZ_X1 = SAFE_ZONE['bottom_right']['x_px']
+_SZ_Y1 = SAFE_ZONE['bottom_right']['y_px']
+
 def validate_bounds(x_px, y_px, width_px=0, height_px=0):
     """
     Validate that element is within Safe Zone bounds.
@@ -891,16 +966,14 @@ def validate_bounds(x_px, y_px, width_px=0, height_px=0):
     Returns:
         True if element is fully within Safe Zone, False otherwise
     """
-    safe_zone = SAFE_ZONE
-
     # Check if top-left corner is within bounds
-    within_x_start = safe_zone['top_left']['x_px'] <= x_px <= safe_zone['bottom_right']['x_px']
-    within_y_start = safe_zone['top_left']['y_px'] <= y_px <= safe_zone['bottom_right']['y_px']
+    within_x_start = _SZ_X0 <= x_px <= _SZ_X1
+    within_y_start = _SZ_Y0 <= y_px <= _SZ_Y1
 
     # Check if bottom-right corner is within bounds (if width/height provided)
     if width_px > 0 and height_px > 0:
-        within_x_end = (x_px + width_px) <= safe_zone['bottom_right']['x_px']
-        within_y_end = (y_px + height_px) <= safe_zone['bottom_right']['y_px']
+        within_x_end = (x_px + width_px) <= _SZ_X1
+        within_y_end = (y_px + height_px) <= _SZ_Y1
         return within_x_start and within_y_start and within_x_end and within_y_end
 
     return within_x_start and within_y_start
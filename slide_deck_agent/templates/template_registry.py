@@ -16,6 +16,7 @@ Usage:
     templates = list_templates()
 """
 
+import threading
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
@@ -25,13 +26,23 @@ class TemplateRegistry:
 
     _templates: Dict[str, Dict[str, Any]] = {}
     _initialized = False
+    _init_lock = threading.Lock()
 
     @classmethod
     def initialize(cls):
         """Initialize the template registry with available templates."""
         if cls._initialized:
             return
+        # Concurrent first callers wait here; only one populates the registry
+        with cls._init_lock:
+            if cls._initialized:
+                return
+            cls._register_builtin_templates()
+            cls._initialized = True
 
+    @classmethod
+    def _register_builtin_templates(cls):
+        """Register the bundled templates (called once, under _init_lock)."""
         # Register AECOM template
         try:
             from .aecom_template_config import AECOM_CONFIG
@@ -49,8 +60,6 @@ class TemplateRegistry:
         # Register default template
         cls.register_template('default', cls._get_default_template())
 
-        cls._initialized = True
-
     @classmethod
     def register_template(cls, name: str, config: Dict[str, Any]):
         """
@@ -75,7 +84,11 @@ class TemplateRegistry:
         """
         if not cls._initialized:
             cls.initialize()
-        return cls._templates.get(name.lower())
+        # Keys are stored lower-case, so most names hit without a lowered copy
+        template = cls._templates.get(name)
+        if template is None:
+            template = cls._templates.get(name.lower())
+        return template
 
     @classmethod
     def list_templates(cls) -> List[str]:
@@ -102,7 +115,7 @@ class TemplateRegistry:
         """
         if not cls._initialized:
             cls.initialize()
-        return name.lower() in cls._templates
+        return name in cls._templates or name.lower() in cls._templates
 
     @staticmethod
     def _get_default_template() -> Dict[str, Any]:
@@ -0,0 +1,21 @@
+"""Tests for ContentAnalyzerSkill's suggested slide structure."""
+
+from slide_deck_agent.skills.content_analyzer import ContentAnalyzerSkill
+
+
+def test_analyze_topic_uses_topic_as_title():
+    slides = ContentAnalyzerSkill().analyze_topic("Retail", num_slides=3)
+
+    assert len(slides) == 3
+    assert slides[0].title == "Retail"
+
+
+def test_mutating_returned_slides_does_not_leak_into_later_calls():
+    analyzer = ContentAnalyzerSkill()
+    first = analyzer.analyze_topic("First")
+    agenda_items = list(first[1].bullet_points)
+
+    first[1].bullet_points.append("Injected item")
+
+    second = analyzer.analyze_topic("Second")
+    assert second[1].bullet_points == agenda_items
@@ -0,0 +1,109 @@
+"""Tests for concurrent per-slide generation in ContentGenerator."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from slide_deck_agent.llapi.content_generator import SLIDE_DRAFT_TOOL, ContentGenerator
+from slide_deck_agent.models import get_single_slide_draft_json_schema
+
+
+class _FakeAsyncClient:
+    """Stand-in for AsyncAnthropic/AsyncOpenAI that records close()."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def _spec(text, follows_previous=False):
+    spec = {"slide_type": "bullet_points", "source_content": text}
+    if follows_previous:
+        spec["follows_previous"] = True
+    return spec
+
+
+def test_results_keep_spec_order():
+    generator = ContentGenerator(provider="mock")
+    specs = [_spec(f"Slide {i}\nPoint {i}") for i in range(6)]
+
+    slides = generator.generate_slides(specs, max_concurrency=2)
+
+    assert [slide["title"] for slide in slides] == [f"Slide {i}" for i in range(6)]
+
+
+def test_chained_slides_see_previous_title(monkeypatch):
+    generator = ContentGenerator(provider="mock")
+    prompts = {}
+    original = generator._generate_slide_async
+
+    async def spy(client, prompt, spec):
+        prompts[spec["source_content"]] = prompt
+        return await original(client, prompt, spec)
+
+    monkeypatch.setattr(generator, "_generate_slide_async", spy)
+    generator.generate_slides([
+        _spec("Intro\nHello"),
+        _spec("Detail\nMore", follows_previous=True),
+        _spec("Other\nUnrelated"),
+    ])
+
+    assert "PREVIOUS SLIDE TITLE: Intro" in prompts["Detail\nMore"]
+    assert "PREVIOUS SLIDE TITLE" not in prompts["Intro\nHello"]
+    assert "PREVIOUS SLIDE TITLE" not in prompts["Other\nUnrelated"]
+
+
+def test_failure_cancels_other_groups_and_closes_client(monkeypatch):
+    generator = ContentGenerator(provider="mock")
+    client = _FakeAsyncClient()
+    cancelled = []
+
+    async def generate(client_arg, prompt, spec):
+        if spec["source_content"] == "fails":
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(spec["source_content"])
+            raise
+        return {"title": "never"}
+
+    monkeypatch.setattr(generator, "_create_async_client", lambda: client)
+    monkeypatch.setattr(generator, "_generate_slide_async", generate)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        generator.generate_slides([_spec("slow"), _spec("fails")])
+
+    assert cancelled == ["slow"]
+    assert client.closed
+
+
+def test_client_closed_after_success(monkeypatch):
+    generator = ContentGenerator(provider="mock")
+    client = _FakeAsyncClient()
+    monkeypatch.setattr(generator, "_create_async_client", lambda: client)
+
+    generator.generate_slides([_spec("Intro\nHello")])
+
+    assert client.closed
+
+
+def test_per_slide_anthropic_call_sends_schema_and_reads_tool_input():
+    generator = ContentGenerator(provider="anthropic", api_key="test")
+    requests = []
+    slide = {"title": "Costs fell 20%", "bullet_points": ["Lower rent"], "notes": ""}
+
+    async def create(**kwargs):
+        requests.append(kwargs)
+        return SimpleNamespace(content=[SimpleNamespace(type="tool_use", input=slide)])
+
+    client = SimpleNamespace(messages=SimpleNamespace(create=create))
+    result = asyncio.run(generator._generate_slide_async(client, "prompt", _spec("Costs")))
+
+    assert result == slide
+    assert requests[0]["tools"][0]["input_schema"] == get_single_slide_draft_json_schema()
+    assert requests[0]["tool_choice"] == {"type": "tool", "name": SLIDE_DRAFT_TOOL}
@@ -0,0 +1,58 @@
+"""Tests for chart annotations in MainSlideGeneratorSkill."""
+
+import pytest
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.util import Inches
+
+from slide_deck_agent.skills.main_slide_generator import MainSlideGeneratorSkill, _ChartArea
+
+CHART_AREA = _ChartArea(1.0, 1.0, 8.0, 4.0)
+
+
+@pytest.fixture
+def chart_slide():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    chart_data = CategoryChartData()
+    chart_data.categories = ["2021", "2022", "2023", "2024"]
+    chart_data.add_series("Revenue", (10, 20, 30, 40))
+    chart_shape = slide.shapes.add_chart(
+        XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(1), Inches(1), Inches(8), Inches(4), chart_data
+    )
+    return slide, chart_shape
+
+
+def _difference_line(slide, chart_shape, from_category, to_category):
+    annotation = {"from_category": from_category, "to_category": to_category, "label": "+10"}
+    return MainSlideGeneratorSkill()._add_difference_line(
+        slide, chart_shape, annotation, CHART_AREA
+    )
+
+
+@pytest.mark.parametrize("from_category, to_category", [(1, 1), (3, -1), (-4, 0)])
+def test_line_from_a_bar_to_itself_is_skipped(chart_slide, from_category, to_category):
+    slide, chart_shape = chart_slide
+    shape_count = len(slide.shapes)
+
+    assert _difference_line(slide, chart_shape, from_category, to_category) == (
+        from_category, to_category
+    )
+    assert len(slide.shapes) == shape_count
+
+
+def test_line_between_two_bars_is_drawn(chart_slide):
+    slide, chart_shape = chart_slide
+    shape_count = len(slide.shapes)
+
+    _difference_line(slide, chart_shape, 0, 1)
+
+    assert len(slide.shapes) > shape_count
+
+
+def test_out_of_range_category_is_not_mistaken_for_the_same_bar(chart_slide):
+    slide, chart_shape = chart_slide
+
+    with pytest.raises(IndexError):
+        _difference_line(slide, chart_shape, 0, 4)
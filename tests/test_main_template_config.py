@@ -0,0 +1,48 @@
+"""Tests for the frozen main template configuration."""
+
+import copy
+import json
+
+import pytest
+
+from slide_deck_agent.templates.main_template_config import (
+    MAIN_CONFIG,
+    REGIONS,
+    SLIDE_BLUEPRINTS,
+    config_to_dict,
+    get_region,
+    validate_bounds,
+)
+
+
+def test_config_is_read_only():
+    with pytest.raises(TypeError):
+        MAIN_CONFIG["grid"]["regions"]["title"]["height_px"] = 1
+
+
+def test_module_tables_share_the_frozen_views():
+    assert get_region("title") is MAIN_CONFIG["grid"]["regions"]["title"] is REGIONS["title"]
+    assert SLIDE_BLUEPRINTS["content_bullets"]["title"] is REGIONS["title"]
+
+
+def test_config_to_dict_supports_deepcopy_and_json():
+    config = config_to_dict()
+
+    customized = copy.deepcopy(config)
+    customized["grid"]["regions"]["title"]["height_px"] = 1
+    assert MAIN_CONFIG["grid"]["regions"]["title"]["height_px"] == 80
+
+    dumped = json.loads(json.dumps(config))
+    assert dumped["colors"]["primary_green"] == "#147B58"
+
+
+def test_config_to_dict_copies_a_single_table():
+    title = config_to_dict(REGIONS["title"])
+    assert type(title) is dict and type(title["bounds"]) is dict
+
+
+def test_validate_bounds_uses_safe_zone():
+    assert validate_bounds(96, 54)
+    assert not validate_bounds(95, 54)
+    assert validate_bounds(100, 100, 1724, 926)
+    assert not validate_bounds(100, 100, 1725, 10)
@@ -0,0 +1,61 @@
+"""Tests for the slide and presentation request models."""
+
+import pytest
+from pydantic import ValidationError
+
+from slide_deck_agent.models import (
+    PresentationDraft,
+    PresentationRequest,
+    SlideContent,
+    SlideType,
+    get_presentation_draft_json_schema,
+)
+
+
+def test_legacy_slide_type_names_resolve_to_standard_content():
+    slide = SlideContent(slide_type="bullet_points", title="Agenda")
+    assert slide.slide_type is SlideType.STANDARD_CONTENT
+
+
+def test_slide_content_is_frozen():
+    slide = SlideContent(slide_type=SlideType.TITLE, title="Deck")
+
+    with pytest.raises(ValidationError):
+        slide.title = "Renamed"
+
+    renamed = slide.model_copy(update={"title": "Renamed"})
+    assert (slide.title, renamed.title) == ("Deck", "Renamed")
+
+
+def test_slide_content_ignores_unknown_keys():
+    slide = SlideContent(slide_type=SlideType.TITLE, title="Deck", key_takeaway="ignored")
+    assert not hasattr(slide, "key_takeaway")
+
+
+def test_presentation_request_stays_mutable():
+    request = PresentationRequest(topic="Deck")
+    request.output_path = "out/deck.pptx"
+    assert request.output_path == "out/deck.pptx"
+
+
+def test_presentation_draft_schema_is_built_once_on_first_use(monkeypatch):
+    get_presentation_draft_json_schema.cache_clear()
+    calls = []
+    build = PresentationDraft.model_json_schema
+    monkeypatch.setattr(
+        PresentationDraft, "model_json_schema",
+        lambda *args, **kwargs: calls.append(1) or build(*args, **kwargs),
+    )
+
+    schema = get_presentation_draft_json_schema()
+    assert get_presentation_draft_json_schema() is schema
+    assert len(calls) == 1
+    assert "slides" in schema["properties"]
+    get_presentation_draft_json_schema.cache_clear()
+
+
+def test_request_models_are_complete_at_import():
+    # Pydantic v2 builds the validator at class definition; no model_rebuild needed
+    for model in (SlideContent, PresentationRequest):
+        assert model.__pydantic_complete__
+        assert type(model.__pydantic_validator__).__name__ == "SchemaValidator"
@@ -0,0 +1,65 @@
+"""Tests for the O(1) next_partname replacement."""
+
+from types import SimpleNamespace
+
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.opc.packuri import PackURI
+from pptx.util import Inches
+
+from slide_deck_agent.skills.pptx_utils import cache_next_partname
+
+CHART_TMPL = "/ppt/charts/chart%d.xml"
+
+
+class _FakePackage:
+    """Package stub exposing only the parts next_partname looks at."""
+
+    def __init__(self, *partnames):
+        self.parts = [SimpleNamespace(partname=PackURI(name)) for name in partnames]
+
+    def iter_parts(self):
+        return iter(self.parts)
+
+    def add(self, partname):
+        self.parts.append(SimpleNamespace(partname=partname))
+        return partname
+
+
+def test_continues_after_highest_existing_index():
+    package = _FakePackage("/ppt/charts/chart1.xml", "/ppt/charts/chart3.xml")
+    cache_next_partname(package)
+
+    issued = [package.add(package.next_partname(CHART_TMPL)) for _ in range(3)]
+
+    assert issued == ["/ppt/charts/chart4.xml", "/ppt/charts/chart5.xml", "/ppt/charts/chart6.xml"]
+
+
+def test_ignores_other_templates_sharing_the_prefix():
+    package = _FakePackage(
+        "/ppt/charts/chart1.xml", "/ppt/charts/chart7.xlsx", "/ppt/slides/slide9.xml"
+    )
+    cache_next_partname(package)
+
+    assert package.next_partname(CHART_TMPL) == "/ppt/charts/chart2.xml"
+    assert package.next_partname("/ppt/slides/slide%d.xml") == "/ppt/slides/slide10.xml"
+
+
+def test_real_presentation_partnames_are_unique():
+    prs = Presentation()
+    cache_next_partname(prs.part.package)
+    chart_data = CategoryChartData()
+    chart_data.categories = ["a", "b"]
+    chart_data.add_series("s", (1, 2))
+
+    for _ in range(3):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_chart(
+            XL_CHART_TYPE.COLUMN_CLUSTERED, 0, 0, Inches(4), Inches(3), chart_data
+        )
+        slide.notes_slide.notes_text_frame.text = "notes"
+
+    partnames = [part.partname for part in prs.part.package.iter_parts()]
+    assert len(partnames) == len(set(partnames))
+    assert {"/ppt/charts/chart1.xml", "/ppt/charts/chart3.xml"} <= set(partnames)
@@ -0,0 +1,47 @@
+"""Tests for the reference structure templates and prompt layout."""
+
+import pytest
+
+from slide_deck_agent.llapi.prompt_templates import PromptTemplates, SlideSpec
+
+
+def test_structure_templates_are_read_only_at_every_level():
+    templates = PromptTemplates.STRUCTURE_TEMPLATES
+    with pytest.raises(TypeError):
+        templates["custom"] = {}
+    with pytest.raises(TypeError):
+        templates["investor_pitch"]["max_slides"] = 99
+
+
+def test_slide_specs_support_attribute_and_key_access():
+    spec = PromptTemplates.get_structure_template("investor_pitch")["structure"][0]
+
+    assert spec.type == spec["type"] == spec.get("type") == "problem"
+    assert spec["purpose"] == spec.purpose
+    assert spec[0] == "problem"
+    assert spec.get("missing", "default") == "default"
+    with pytest.raises(KeyError):
+        spec["count"]
+
+
+def test_slide_spec_round_trips_to_dict():
+    spec = SlideSpec("problem", "Pain point")
+    assert spec._asdict() == {"type": "problem", "purpose": "Pain point"}
+
+
+def test_schema_backed_prompts_carry_no_json_example():
+    full = PromptTemplates.get_full_presentation_prompt("Doc", "investor_pitch", max_slides=5)
+    single = PromptTemplates.get_slide_generation_prompt("problem", "Doc", 1, 5)
+
+    for prompt in (full, single):
+        assert "OUTPUT FORMAT" not in prompt
+    assert '"presentation_title"' not in full
+    # chart_data is free-form in the schema, so its example stays
+    assert '"highlight_index": 1' in full
+    assert '"type": "cagr_arrow"' in full
+
+
+def test_bullet_refinement_prompt_accepts_non_string_bullets():
+    prompt = PromptTemplates.get_bullet_refinement_prompt(["Revenue up", 42, 3.5], "Growth")
+    assert prompt.endswith("CURRENT BULLETS:\n- Revenue up\n- 42\n- 3.5")
+    assert PromptTemplates.get_bullet_refinement_prompt([], "Growth").endswith("CURRENT BULLETS:\n")
@@ -0,0 +1,121 @@
+"""Tests for the persistent per-slide prompt cache."""
+
+import pytest
+
+from slide_deck_agent.llapi import slide_cache as slide_cache_module
+from slide_deck_agent.llapi.content_generator import ContentGenerator
+from slide_deck_agent.llapi.prompt_templates import PromptTemplates
+from slide_deck_agent.llapi.slide_cache import SlidePromptCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    slide_cache = SlidePromptCache(str(tmp_path / "slides.sqlite3"))
+    yield slide_cache
+    slide_cache.close()
+
+
+def _counting_generator(cache, monkeypatch):
+    """Mock-provider generator that records which slides reach the LLM."""
+    generator = ContentGenerator(provider="mock", slide_cache=cache)
+    generated = []
+    original = generator._generate_slide_async
+
+    async def spy(client, prompt, spec):
+        generated.append(spec["source_content"])
+        return await original(client, prompt, spec)
+
+    monkeypatch.setattr(generator, "_generate_slide_async", spy)
+    return generator, generated
+
+
+def test_get_returns_none_on_miss(cache):
+    key = cache.make_key("mock", None, "bullet_points", "Growth\nRevenue up")
+    assert cache.get(key) is None
+
+
+def test_set_then_get_hits(cache):
+    key = cache.make_key("mock", None, "bullet_points", "Growth\nRevenue up")
+    response = {"title": "Growth", "bullet_points": ["Revenue up"], "notes": ""}
+    cache.set(key, response)
+    assert cache.get(key) == response
+
+
+def test_key_depends_on_content_not_position(cache):
+    key = cache.make_key("mock", None, "bullet_points", "Growth")
+    assert key == cache.make_key("mock", None, "bullet_points", "Growth")
+    assert key != cache.make_key("mock", None, "bullet_points", "Costs")
+    assert key != cache.make_key("mock", None, "title_content", "Growth")
+
+
+def test_key_depends_on_previous_title(cache):
+    independent = cache.make_key("mock", None, "bullet_points", "Details")
+    after_a = cache.make_key("mock", None, "bullet_points", "Details", previous_title="A")
+    after_b = cache.make_key("mock", None, "bullet_points", "Details", previous_title="B")
+    assert len({independent, after_a, after_b}) == 3
+
+
+@pytest.mark.parametrize("patch", [
+    lambda mp: mp.setattr(PromptTemplates, "SYSTEM_PROMPT", "Be terse."),
+    lambda mp: mp.setattr(PromptTemplates, "SLIDE_GENERATION_MAX_TOKENS", 2048),
+    lambda mp: mp.setattr(slide_cache_module, "CACHE_FORMAT_VERSION", 2),
+    lambda mp: mp.setattr(
+        slide_cache_module, "get_single_slide_draft_json_schema", lambda: {"type": "object"}
+    ),
+    lambda mp: mp.setattr(
+        PromptTemplates, "get_slide_generation_prompt",
+        staticmethod(lambda *args, **kwargs: "New template")
+    ),
+])
+def test_key_changes_with_shared_request_inputs(tmp_path, monkeypatch, patch):
+    def key_for(name):
+        slide_cache = SlidePromptCache(str(tmp_path / name))
+        try:
+            return slide_cache.make_key("anthropic", "model", "bullet_points", "Growth")
+        finally:
+            slide_cache.close()
+
+    before = key_for("before.sqlite3")
+    patch(monkeypatch)
+    assert key_for("after.sqlite3") != before
+
+
+def test_repeated_deck_is_served_from_cache(cache, monkeypatch):
+    generator, generated = _counting_generator(cache, monkeypatch)
+    specs = [
+        {"slide_type": "bullet_points", "source_content": "Growth\nRevenue up"},
+        {"slide_type": "bullet_points", "source_content": "Costs\nOpex down"},
+    ]
+
+    first = generator.generate_slides(specs)
+    second = generator.generate_slides(specs)
+
+    assert second == first
+    assert generated == ["Growth\nRevenue up", "Costs\nOpex down"]
+
+
+def test_chained_slide_is_not_reused_under_another_predecessor(cache, monkeypatch):
+    generator, generated = _counting_generator(cache, monkeypatch)
+    chained = {
+        "slide_type": "bullet_points",
+        "source_content": "Details\nMore detail",
+        "follows_previous": True,
+    }
+
+    generator.generate_slides([
+        {"slide_type": "bullet_points", "source_content": "Growth\nRevenue up"}, chained
+    ])
+    generated.clear()
+    generator.generate_slides([
+        {"slide_type": "bullet_points", "source_content": "Costs\nOpex down"}, chained
+    ])
+
+    # New predecessor title: the chained slide must be regenerated
+    assert generated == ["Costs\nOpex down", "Details\nMore detail"]
+
+    generated.clear()
+    generator.generate_slides([
+        {"slide_type": "bullet_points", "source_content": "Costs\nOpex down"}, chained
+    ])
+    # Same predecessor again: both slides come from the cache
+    assert generated == []
@@ -0,0 +1,64 @@
+"""Tests for StructureRecommender section matching and document preparation."""
+
+from slide_deck_agent.llapi.structure_recommender import StructureRecommender
+
+SECTIONS = {
+    "introduction": "Acme builds widgets.",
+    "problem_statement": "Widgets are too expensive.",
+    "legal_boilerplate": "All rights reserved.",
+    "market_size": "The widget market is large.",
+}
+
+
+def test_irrelevant_sections_are_dropped():
+    document = StructureRecommender().prepare_document(SECTIONS, "investor_pitch")
+
+    assert document == (
+        "## introduction\nAcme builds widgets.\n\n"
+        "## problem_statement\nWidgets are too expensive.\n\n"
+        "## market_size\nThe widget market is large."
+    )
+
+
+def test_whole_document_kept_when_only_introduction_matches():
+    sections = {"introduction": "Acme builds widgets.", "legal_boilerplate": "All rights reserved."}
+
+    document = StructureRecommender().prepare_document(sections, "investor_pitch")
+
+    assert "## legal_boilerplate" in document
+
+
+def test_document_truncated_to_budget_at_line_boundary():
+    sections = {"problem": "\n".join(f"line {i}" for i in range(100))}
+
+    document = StructureRecommender().prepare_document(
+        sections, "investor_pitch", token_budget=10, chars_per_token=4
+    )
+
+    assert len(document) <= 40
+    assert document.endswith(("line 0", "line 1", "line 2", "line 3"))
+
+
+def test_first_section_containing_a_keyword_wins():
+    sections = {
+        "Current_State": "Costs are high.",
+        "pain_points": "Later pain.",
+        "vision": "Everywhere.",
+    }
+
+    structure = StructureRecommender().recommend_structure(sections, "investor_pitch", max_slides=3)
+
+    assert [(s["slide_type"], s["source_content"]) for s in structure] == [
+        ("problem", "Costs are high."),
+        ("solution", None),
+        ("market", None),
+    ]
+
+
+def test_available_types_are_a_fresh_list():
+    recommender = StructureRecommender()
+    types = recommender.get_available_types()
+    types.append("custom")
+
+    assert "custom" not in recommender.get_available_types()
+    assert recommender.get_available_types()[0] == "investor_pitch"